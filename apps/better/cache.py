@@ -0,0 +1,68 @@
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Max
+
+from apps.better.models import Importance
+
+# Invalidation only reaches the process that saved the change, so other
+# worker processes fall back to refreshing after this many seconds
+IMPORTANCE_CACHE_TIMEOUT = 60
+
+# The highest importance score is written into stored scores, so it lives in the
+# shared Django cache, where every worker sees the signal handlers delete it
+MAX_IMPORTANCE_SCORE_KEY = 'better:importance:max_score'
+
+_importance_cache = None
+_importance_cache_expires_at = 0.0
+_lock = threading.Lock()
+
+
+def _is_fresh():
+    return _importance_cache is not None and time.monotonic() < _importance_cache_expires_at
+
+
+def get_importances():
+    """
+    Return all importance levels ordered by score (highest first).
+    The result is cached per process and shared between callers, so it is a tuple.
+    """
+    global _importance_cache, _importance_cache_expires_at
+
+    if _is_fresh():
+        return _importance_cache
+
+    # Rows read inside a transaction may still be rolled back, so don't cache them
+    if connection.in_atomic_block:
+        return tuple(Importance.objects.order_by('-score'))
+
+    with _lock:
+        if not _is_fresh():
+            _importance_cache = tuple(Importance.objects.order_by('-score'))
+            _importance_cache_expires_at = time.monotonic() + IMPORTANCE_CACHE_TIMEOUT
+        return _importance_cache
+
+
+def get_max_importance_score():
+    """Return the highest importance score, memoized in the shared cache"""
+    max_score = cache.get(MAX_IMPORTANCE_SCORE_KEY)
+    if max_score is not None:
+        return max_score
+
+    max_score = Importance.objects.aggregate(max_score=Max('score'))['max_score'] or 0
+    # As with the levels, a value read inside a transaction may be rolled back
+    if not connection.in_atomic_block:
+        cache.set(MAX_IMPORTANCE_SCORE_KEY, max_score, None)
+    return max_score
+
+
+def invalidate_importances():
+    """
+    Drop this process's cached importance levels and the shared highest score,
+    so the next reads hit the database
+    """
+    global _importance_cache
+    _importance_cache = None
+    cache.delete(MAX_IMPORTANCE_SCORE_KEY)
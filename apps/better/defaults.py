@@ -0,0 +1,38 @@
+from types import MappingProxyType
+
+# Default categories with descriptions that guide users to add correct targets
+DEFAULT_CATEGORIES = (
+    {
+        'name': 'Finance',
+        'description': 'Targets that help you add future pleasure through money or remove future pain from financial stress. Examples: increase income, reduce expenses, build savings, pay off debt.'
+    },
+    {
+        'name': 'Health',
+        'description': 'Targets that help you add health or remove sickness and discomfort. Examples: exercise, eat nutritious meals, get medical checkups, practice mental wellness.'
+    },
+    {
+        'name': 'Energy',
+        'description': 'Targets that help you save time or remove effort from your day. Examples: optimize routines, eliminate time-wasters, automate tasks, improve productivity systems.'
+    },
+    {
+        'name': 'Opinion',
+        'description': 'Targets that help you add status in society or protect your reputation. Examples: build professional image, expand network, develop valued skills, manage public perception.'
+    },
+    {
+        'name': 'Connection',
+        'description': 'Targets that help you add meaningful relationships and connection or remove loneliness. Examples: strengthen relationships, make new connections, show care for others, build meaningful bonds.'
+    },
+    {
+        'name': 'Safety',
+        'description': 'Targets that help you add security and protection or remove risk and danger. Examples: ensure physical safety, build financial security, create emotional stability, get insurance.'
+    },
+    {
+        'name': 'Knowledge',
+        'description': 'Targets that help you expand understanding and capabilities. Examples: learn new skills, gain valuable information, solve problems, improve decision-making abilities.'
+    }
+)
+
+# Category name -> description lookup for the default categories
+DEFAULT_DESCRIPTIONS = MappingProxyType({
+    category['name']: category['description'] for category in DEFAULT_CATEGORIES
+})
@@ -1,8 +1,43 @@
 from django import forms
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.forms.models import ModelChoiceIterator
+from .cache import get_importances
 from .models import TargetCategory, Target, Importance
 
 
+def violates_constraint(instance, constraint_name):
+    """
+    Return whether the instance breaks the named model constraint, so a save()
+    that failed with an IntegrityError can tell it apart from other failures.
+    """
+    constraint = next(c for c in instance._meta.constraints if c.name == constraint_name)
+    try:
+        constraint.validate(type(instance), instance)
+    except ValidationError:
+        return True
+    return False
+
+
+class PrefetchedChoiceIterator(ModelChoiceIterator):
+    """
+    Choice iterator that renders options from objects the caller already fetched,
+    so rendering a select does not run the field's queryset again.
+    """
+    
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.field.prefetched_objects:
+            yield self.choice(obj)
+    
+    def __len__(self):
+        return len(self.field.prefetched_objects) + (self.field.empty_label is not None)
+    
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.field.prefetched_objects)
+
+
 class TargetCategoryForm(forms.ModelForm):
     """
     Form for creating and updating target categories.
@@ -12,14 +47,13 @@ class TargetCategoryForm(forms.ModelForm):
     class Meta:
         model = TargetCategory
         fields = ['name', 'description']
+        help_texts = {
+            'name': 'Category name must be unique for the current day',
+        }
     
     def __init__(self, *args, current_day=None, **kwargs):
         self.current_day = current_day
         super().__init__(*args, **kwargs)
-        
-        # Add required attribute to name field
-        self.fields['name'].required = True
-        self.fields['name'].help_text = 'Category name must be unique for the current day'
     
     def clean_name(self):
         """
@@ -39,22 +73,29 @@ class TargetCategoryForm(forms.ModelForm):
         if len(name) > 200:
             raise ValidationError('Category name cannot exceed 200 characters.')
         
-        # Check uniqueness for current day (excluding current instance if updating)
-        if self.current_day:
-            existing_categories = TargetCategory.objects.filter(
-                day=self.current_day,
-                name__iexact=name,
-                is_deleted=False
-            )
-            
-            # If updating, exclude current instance
-            if self.instance and self.instance.pk:
-                existing_categories = existing_categories.exclude(pk=self.instance.pk)
-            
-            if existing_categories.exists():
-                raise ValidationError(f'A category with the name "{name}" already exists for this day.')
-        
+        # Uniqueness per day is enforced by the database constraint and
+        # reported from save(), so valid submissions cost a single INSERT.
         return name
+    
+    def save(self, commit=True):
+        """
+        Save the category, reporting a duplicate name for the day as a form error.
+        Raises ValidationError when the unique name constraint is violated and
+        re-raises any other IntegrityError.
+        """
+        if not commit:
+            return super().save(commit=False)
+        
+        name = self.cleaned_data['name']
+        try:
+            with transaction.atomic():
+                return super().save()
+        except IntegrityError:
+            if not violates_constraint(self.instance, 'unique_category_name_per_day'):
+                raise
+            error = ValidationError(f'A category with the name "{name}" already exists for this day.')
+            self.add_error('name', error)
+            raise error
 
 
 class TargetForm(forms.ModelForm):
@@ -66,14 +107,22 @@ class TargetForm(forms.ModelForm):
     class Meta:
         model = Target
         fields = ['name', 'category', 'importance']
+        # Applied once to the class's base fields rather than on every instantiation;
+        # the model fields are already required, so they need no per-form override
+        help_texts = {
+            'name': 'Descriptive name for your target',
+            'category': 'Select the category this target belongs to',
+            'importance': 'Choose the importance level for this target',
+        }
     
-    def __init__(self, *args, current_day=None, **kwargs):
+    def __init__(self, *args, current_day=None, categories=None, importance_levels=None, **kwargs):
         self.current_day = current_day
         super().__init__(*args, **kwargs)
         
         # Filter categories to current day only
         if self.current_day:
-            self.fields['category'].queryset = TargetCategory.objects.filter(
+            # Join the day so option labels and clean_category don't query it per row
+            self.fields['category'].queryset = TargetCategory.objects.select_related('day').filter(
                 day=self.current_day,
                 is_deleted=False
             ).order_by('name')
@@ -84,18 +133,24 @@ class TargetForm(forms.ModelForm):
         # Set importance queryset to all available importance levels
         self.fields['importance'].queryset = Importance.objects.all().order_by('-score')
         
-        # Add required attributes and help text
-        self.fields['name'].required = True
-        self.fields['category'].required = True
-        self.fields['importance'].required = True
-        
-        self.fields['name'].help_text = 'Descriptive name for your target'
-        self.fields['category'].help_text = 'Select the category this target belongs to'
-        self.fields['importance'].help_text = 'Choose the importance level for this target'
-        
         # Add empty labels for better UX
         self.fields['category'].empty_label = "Select a category"
         self.fields['importance'].empty_label = "Select importance level"
+        
+        # Render options from lists the caller already fetched, if provided;
+        # importance levels otherwise come from the process-level cache
+        if categories is not None:
+            self._use_prefetched_choices('category', categories)
+        if importance_levels is None:
+            importance_levels = get_importances()
+        self._use_prefetched_choices('importance', importance_levels)
+    
+    def _use_prefetched_choices(self, field_name, objects):
+        """Render a choice field from prefetched objects; validation still uses its queryset."""
+        field = self.fields[field_name]
+        field.prefetched_objects = objects
+        field.iterator = PrefetchedChoiceIterator
+        field.widget.choices = field.choices
     
     def clean_name(self):
         """
@@ -128,7 +183,7 @@ class TargetForm(forms.ModelForm):
             raise ValidationError('Please select a category.')
         
         # Ensure category belongs to current day and is not deleted
-        if self.current_day and category.day != self.current_day:
+        if self.current_day and category.day_id != self.current_day.pk:
             raise ValidationError('Selected category does not belong to the current day.')
         
         if category.is_deleted:
@@ -158,16 +213,22 @@ class ImportanceForm(forms.ModelForm):
     class Meta:
         model = Importance
         fields = ['label', 'score']
+        help_texts = {
+            'label': 'Descriptive label for this importance level',
+            'score': 'Numeric score (higher numbers = more important)',
+        }
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Add required attributes and help text
-        self.fields['label'].required = True
-        self.fields['score'].required = True
-        
-        self.fields['label'].help_text = 'Descriptive label for this importance level'
-        self.fields['score'].help_text = 'Numeric score (higher numbers = more important)'
+    def _get_validation_exclusions(self):
+        """
+        Leave label and score out of model validation: clean_label and clean_score
+        already enforce their field validators and the unique_importance_label and
+        importance_score_positive constraints, so the model would only repeat them
+        with queries. save() still reports a label that clashes in a race.
+        This is a private ModelForm hook; ImportanceFormTests pins its effect.
+        """
+        exclude = super()._get_validation_exclusions()
+        exclude.update({'label', 'score'})
+        return exclude
     
     def clean_label(self):
         """
@@ -187,15 +248,16 @@ class ImportanceForm(forms.ModelForm):
         if len(label) > 200:
             raise ValidationError('Importance label cannot exceed 200 characters.')
         
-        # Check uniqueness (case-insensitive)
-        existing_importance = Importance.objects.filter(label__iexact=label)
-        
-        # If updating, exclude current instance
-        if self.instance and self.instance.pk:
-            existing_importance = existing_importance.exclude(pk=self.instance.pk)
+        # An unchanged label on update cannot clash, so skip the lookup
+        label_lower = label.lower()
+        if self.instance.pk and self.instance.label and self.instance.label.strip().lower() == label_lower:
+            return label
         
-        if existing_importance.exists():
-            raise ValidationError(f'An importance level with the label "{label}" already exists.')
+        # Check uniqueness (case-insensitive) against the cached importance levels;
+        # the unique_importance_label constraint remains the final guard
+        for importance in get_importances():
+            if importance.label.lower() == label_lower and importance.pk != self.instance.pk:
+                raise ValidationError(f'An importance level with the label "{label}" already exists.')
         
         return label
     
@@ -216,6 +278,26 @@ class ImportanceForm(forms.ModelForm):
             raise ValidationError('Importance score is too large.')
         
         return score
+    
+    def save(self, commit=True):
+        """
+        Save the importance level, reporting a concurrent duplicate label as a form error.
+        Raises ValidationError when the unique label constraint is violated and
+        re-raises any other IntegrityError.
+        """
+        if not commit:
+            return super().save(commit=False)
+        
+        label = self.cleaned_data['label']
+        try:
+            with transaction.atomic():
+                return super().save()
+        except IntegrityError:
+            if not violates_constraint(self.instance, 'unique_importance_label'):
+                raise
+            error = ValidationError(f'An importance level with the label "{label}" already exists.')
+            self.add_error('label', error)
+            raise error
 
 
 class TargetAchievementForm(forms.Form):
@@ -243,9 +325,13 @@ class TargetAchievementForm(forms.Form):
         if not target_id:
             raise ValidationError('Target ID is required.')
         
-        try:
-            Target.objects.get(id=target_id, is_deleted=False)
-        except Target.DoesNotExist:
+        # The caller already loaded the target, so validate against it without a query
+        if self.target is not None:
+            if target_id != self.target.id or self.target.is_deleted:
+                raise ValidationError('Target not found or no longer available.')
+            return target_id
+        
+        if not Target.objects.filter(id=target_id, is_deleted=False).exists():
             raise ValidationError('Target not found or no longer available.')
         
         return target_id
@@ -288,12 +374,14 @@ class SleepWakeTimeForm(forms.Form):
         
         # Combine date with time to create datetime objects
         day_date = self.instance.day
+        changed_fields = []
         
         if wake_time:
             wake_datetime = timezone.make_aware(
                 datetime.combine(day_date, wake_time)
             )
             self.instance.wake_time = wake_datetime
+            changed_fields.append('wake_time')
         
         if sleep_time:
             # Sleep time could be next day if it's earlier than wake time
@@ -307,9 +395,12 @@ class SleepWakeTimeForm(forms.Form):
                 sleep_datetime += timedelta(days=1)
             
             self.instance.sleep_time = sleep_datetime
+            changed_fields.append('sleep_time')
         elif 'sleep_time' in self.cleaned_data:
             # If sleep_time field was submitted but empty, clear it
             self.instance.sleep_time = None
+            changed_fields.append('sleep_time')
         
-        self.instance.save()
+        # Only write the time columns rather than the whole row
+        self.instance.save(update_fields=[*changed_fields, 'updated_at'])
         return self.instance
\ No newline at end of file
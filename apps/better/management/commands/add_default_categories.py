@@ -1,6 +1,10 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
+from apps.better.defaults import DEFAULT_CATEGORIES, DEFAULT_DESCRIPTIONS
 from apps.better.models import ScoreDay, TargetCategory
+from apps.better.scoring import coalesce_recalculations
 
 
 class Command(BaseCommand):
@@ -28,39 +32,10 @@ class Command(BaseCommand):
             help='Delete categories that have no targets',
         )
 
+    # Commit every insert, update and the score recalculation together,
+    # so a failure part-way through leaves the day untouched
+    @transaction.atomic
     def handle(self, *args, **options):
-        # Default categories with descriptions that guide users to add correct targets
-        default_categories = [
-            {
-                'name': 'Finance',
-                'description': 'Targets that help you add future pleasure through money or remove future pain from financial stress. Examples: increase income, reduce expenses, build savings, pay off debt.'
-            },
-            {
-                'name': 'Health', 
-                'description': 'Targets that help you add health or remove sickness and discomfort. Examples: exercise, eat nutritious meals, get medical checkups, practice mental wellness.'
-            },
-            {
-                'name': 'Energy',
-                'description': 'Targets that help you save time or remove effort from your day. Examples: optimize routines, eliminate time-wasters, automate tasks, improve productivity systems.'
-            },
-            {
-                'name': 'Opinion',
-                'description': 'Targets that help you add status in society or protect your reputation. Examples: build professional image, expand network, develop valued skills, manage public perception.'
-            },
-            {
-                'name': 'Connection',
-                'description': 'Targets that help you add meaningful relationships and connection or remove loneliness. Examples: strengthen relationships, make new connections, show care for others, build meaningful bonds.'
-            },
-            {
-                'name': 'Safety',
-                'description': 'Targets that help you add security and protection or remove risk and danger. Examples: ensure physical safety, build financial security, create emotional stability, get insurance.'
-            },
-            {
-                'name': 'Knowledge',
-                'description': 'Targets that help you expand understanding and capabilities. Examples: learn new skills, gain valuable information, solve problems, improve decision-making abilities.'
-            }
-        ]
-
         # Determine the target date
         if options['date']:
             try:
@@ -89,7 +64,7 @@ class Command(BaseCommand):
 
         # Handle update-all option first
         if options['update_all']:
-            self.update_all_categories(default_categories)
+            self.update_all_categories()
             return
 
         # Handle delete-empty option
@@ -104,40 +79,73 @@ class Command(BaseCommand):
         categories_updated = 0
         categories_skipped = 0
 
-        for category_data in default_categories:
-            try:
-                category, category_created = TargetCategory.objects.get_or_create(
-                    day=score_day,
-                    name=category_data['name'],
-                    defaults={
-                        'description': category_data['description'],
-                        'score': None,
-                        'max_score': None
-                    }
-                )
-
-                if category_created:
-                    categories_added += 1
-                    self.stdout.write(
-                        self.style.SUCCESS(f'✓ Added category: {category_data["name"]}')
-                    )
-                elif options['overwrite']:
-                    category.description = category_data['description']
-                    category.save()
-                    categories_updated += 1
-                    self.stdout.write(
-                        self.style.WARNING(f'↻ Updated category: {category_data["name"]}')
-                    )
-                else:
-                    categories_skipped += 1
-                    self.stdout.write(
-                        self.style.WARNING(f'- Skipped existing category: {category_data["name"]}')
+        # Fetch every existing default category for the day in one query,
+        # loading only the columns the overwrite path reads and writes. Names
+        # are unique per day regardless of case, so match and key them lowercased
+        existing_categories = {
+            category.name.lower(): category
+            for category in TargetCategory.objects.annotate(
+                lower_name=Lower('name')
+            ).filter(
+                day=score_day,
+                lower_name__in=[name.lower() for name in DEFAULT_DESCRIPTIONS]
+            ).only('name', 'description')
+        }
+        categories_to_update = []
+        # Collect the per-category lines and write them in one call after the loop
+        lines = []
+
+        for category_data in DEFAULT_CATEGORIES:
+            category = existing_categories.get(category_data['name'].lower())
+
+            if category is None:
+                # TargetCategory inherits from a concrete BaseModel, so bulk_create
+                # is not available and missing rows are inserted one by one
+                try:
+                    # Savepoint so one failed insert doesn't abort the whole transaction
+                    with transaction.atomic():
+                        TargetCategory.objects.create(
+                            day=score_day,
+                            name=category_data['name'],
+                            description=category_data['description'],
+                            score=None,
+                            max_score=None
+                        )
+                except Exception as e:
+                    lines.append(
+                        self.style.ERROR(f'Error adding category {category_data["name"]}: {str(e)}')
                     )
+                    continue
 
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'Error adding category {category_data["name"]}: {str(e)}')
+                categories_added += 1
+                lines.append(
+                    self.style.SUCCESS(f'✓ Added category: {category_data["name"]}')
                 )
+            elif options['overwrite']:
+                category.description = category_data['description']
+                categories_to_update.append(category)
+                categories_updated += 1
+                lines.append(
+                    self.style.WARNING(f'↻ Updated category: {category_data["name"]}')
+                )
+            else:
+                categories_skipped += 1
+                lines.append(
+                    self.style.WARNING(f'- Skipped existing category: {category_data["name"]}')
+                )
+
+        if lines:
+            self.stdout.write('\n'.join(lines))
+
+        if categories_to_update:
+            # bulk_update skips auto_now, so stamp updated_at as save() would;
+            # the dashboard cache key is built from it
+            now = timezone.now()
+            for category in categories_to_update:
+                category.updated_at = now
+            TargetCategory.objects.bulk_update(
+                categories_to_update, ['description', 'updated_at'], batch_size=1000
+            )
 
         # Summary
         self.stdout.write('\n' + '='*50)
@@ -146,7 +154,7 @@ class Command(BaseCommand):
         self.stdout.write(f'Categories skipped: {categories_skipped}')
         
         if categories_added > 0 or categories_updated > 0:
-            # Recalculate scores for the day
+            # Scores every category from one grouped query and a bulk update
             score_day.calculate_scores()
             self.stdout.write(
                 self.style.SUCCESS(f'Recalculated scores for {target_date}')
@@ -156,21 +164,16 @@ class Command(BaseCommand):
             self.style.SUCCESS(f'\nDefault categories setup complete for {target_date}!')
         )
 
-    def update_all_categories(self, default_categories):
+    def update_all_categories(self):
         """Update descriptions for all existing categories across all days"""
-        category_descriptions = {cat['name']: cat['description'] for cat in default_categories}
-        
         updated_count = 0
-        for category_name, description in category_descriptions.items():
-            categories = TargetCategory.objects.filter(
-                name=category_name,
+        for category_name, description in DEFAULT_DESCRIPTIONS.items():
+            # One UPDATE per name; descriptions do not affect scores, so the
+            # per-row save() signals that recalculated each day are not needed
+            updated_count += TargetCategory.objects.filter(
+                name__iexact=category_name,
                 is_deleted=False
-            )
-            
-            for category in categories:
-                category.description = description
-                category.save()
-                updated_count += 1
+            ).update(description=description, updated_at=timezone.now())
         
         self.stdout.write('\n' + '='*50)
         self.stdout.write(f'Updated descriptions for {updated_count} categories across all days')
@@ -183,12 +186,18 @@ class Command(BaseCommand):
         empty_categories = score_day.categories.filter(
             is_deleted=False,
             targets__isnull=True
-        ).distinct()
+        )
         
-        deleted_count = 0
-        for category in empty_categories:
-            self.stdout.write(f'Deleting empty category: {category.name}')
-            category.delete()
-            deleted_count += 1
+        lines = [
+            f'Deleting empty category: {category_name}'
+            for category_name in empty_categories.values_list('name', flat=True)
+        ]
+        if lines:
+            self.stdout.write('\n'.join(lines))
         
-        return deleted_count
\ No newline at end of file
+        # Each deleted row sends post_delete, which would rescore the day once per
+        # category; defer those so the day is rescored once at the end.
+        # The total also counts the BaseModel parent rows, so report the categories only
+        with coalesce_recalculations():
+            _, deleted_per_model = empty_categories.delete()
+        return deleted_per_model.get(TargetCategory._meta.label, 0)
\ No newline at end of file
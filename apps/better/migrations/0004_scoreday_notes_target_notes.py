@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('better', '0003_targetcategory_description'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scoreday',
+            name='notes',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='target',
+            name='notes',
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:49
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('better', '0004_scoreday_notes_target_notes'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='targetcategory',
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name='importance',
+            name='label',
+            field=models.CharField(max_length=200),
+        ),
+        migrations.AddConstraint(
+            model_name='importance',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('label'), name='unique_importance_label', violation_error_message='An importance level with this label already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='targetcategory',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), models.F('day'), name='unique_category_name_per_day', violation_error_message='A category with this name already exists for this day.'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('better', '0005_case_insensitive_unique_names'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='target',
+            index=models.Index(fields=['category', 'is_achieved'], name='target_category_achieved_idx'),
+        ),
+    ]
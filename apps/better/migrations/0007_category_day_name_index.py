@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('better', '0006_target_category_achieved_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='targetcategory',
+            index=models.Index(fields=['day', 'name'], name='category_day_name_idx'),
+        ),
+    ]
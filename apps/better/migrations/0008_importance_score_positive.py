@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('better', '0007_category_day_name_index'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='importance',
+            constraint=models.CheckConstraint(condition=models.Q(('score__gt', 0)), name='importance_score_positive', violation_error_message='Importance score must be at least 1.'),
+        ),
+    ]
@@ -1,8 +1,18 @@
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Lag, Lower
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 
+from .scoring import (
+    coalesce_recalculations,
+    display_score,
+    normalized_score,
+    recalculate_day,
+    score_color_class,
+)
+
 
 class BaseModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -11,11 +21,23 @@ class BaseModel(models.Model):
 
 
 class Importance(models.Model):
-    label = models.CharField(max_length=200, unique=True)
+    label = models.CharField(max_length=200)
     score = models.PositiveIntegerField(validators=[MinValueValidator(1)])
 
     class Meta:
         ordering = ['-score']
+        constraints = [
+            models.UniqueConstraint(
+                Lower('label'),
+                name='unique_importance_label',
+                violation_error_message='An importance level with this label already exists.',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(score__gt=0),
+                name='importance_score_positive',
+                violation_error_message='Importance score must be at least 1.',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.label} ({self.score})"
@@ -23,22 +45,25 @@ class Importance(models.Model):
     @classmethod
     def get_max_score(cls):
         """Return highest importance score for max calculations"""
-        max_importance = cls.objects.aggregate(max_score=models.Max('score'))
-        return max_importance['max_score'] or 0
+        from .cache import get_max_importance_score
+
+        # Memoized in the shared cache rather than per process, since the value is
+        # stored in scores and every worker must see a change at once
+        return get_max_importance_score()
 
     @classmethod
     def get_management_context(cls):
         """Get context data for importance management page"""
         from .forms import ImportanceForm
 
-        importance_levels = cls.objects.all().order_by('-score')
+        importance_levels = list(cls.objects.all().order_by('-score'))
         create_form = ImportanceForm()
 
         return {
             'importance_levels': importance_levels,
             'create_form': create_form,
             'page_title': 'Manage Importance Levels',
-            'has_importance_levels': importance_levels.exists(),
+            'has_importance_levels': bool(importance_levels),
         }
 
     @classmethod
@@ -49,20 +74,24 @@ class Importance(models.Model):
         form = ImportanceForm(form_data)
 
         if form.is_valid():
-            importance = form.save()
-            success_message = (
-                f'Importance level "{importance.label}" with score {importance.score} '
-                f'has been created successfully. All scores have been recalculated automatically.'
-            )
-            return importance, success_message, None
+            try:
+                importance = form.save()
+            except ValidationError:
+                pass  # Duplicate label, the form now carries the error
+            else:
+                success_message = (
+                    f'Importance level "{importance.label}" with score {importance.score} '
+                    f'has been created successfully. All scores have been recalculated automatically.'
+                )
+                return importance, success_message, None
 
         # Form has errors - return context for re-rendering
-        importance_levels = cls.objects.all().order_by('-score')
+        importance_levels = list(cls.objects.all().order_by('-score'))
         context = {
             'importance_levels': importance_levels,
             'create_form': form,  # Form with errors
             'page_title': 'Manage Importance Levels',
-            'has_importance_levels': importance_levels.exists(),
+            'has_importance_levels': bool(importance_levels),
             'form_errors': True,
         }
         return None, None, context
@@ -75,27 +104,33 @@ class Importance(models.Model):
         form = ImportanceForm(form_data, instance=self)
 
         if form.is_valid():
-            updated_importance = form.save()
-
-            # Generate appropriate success message
-            if original_score != updated_importance.score:
-                success_message = (
-                    f'Importance level "{updated_importance.label}" has been updated successfully. '
-                    f'Score changed from {original_score} to {updated_importance.score}. '
-                    f'All scores have been recalculated automatically.'
-                )
+            try:
+                updated_importance = form.save()
+            except ValidationError:
+                pass  # Duplicate label, the form now carries the error
             else:
-                success_message = (
-                    f'Importance level "{updated_importance.label}" has been updated successfully.'
-                )
-
-            return updated_importance, success_message, None
+                # Generate appropriate success message
+                if original_score != updated_importance.score:
+                    success_message = (
+                        f'Importance level "{updated_importance.label}" has been updated successfully. '
+                        f'Score changed from {original_score} to {updated_importance.score}. '
+                        f'All scores have been recalculated automatically.'
+                    )
+                else:
+                    success_message = (
+                        f'Importance level "{updated_importance.label}" has been updated successfully.'
+                    )
+
+                return updated_importance, success_message, None
 
         # Form has validation errors
         error_messages = []
         for field, errors in form.errors.items():
             for error in errors:
-                error_messages.append(f'{field.title()}: {error}')
+                if field == NON_FIELD_ERRORS:
+                    error_messages.append(error)
+                else:
+                    error_messages.append(f'{field.title()}: {error}')
 
         return None, None, error_messages
 
@@ -163,21 +198,18 @@ class Importance(models.Model):
         if not importance_id:
             return 'error', 'No importance level specified for update.', None
 
-        try:
-            importance = get_object_or_404(cls, id=importance_id)
-            updated_importance, success_message, error_messages = importance.update_from_form(form_data)
+        importance = cls._get_for_action(importance_id)
+        if importance is None:
+            return 'error', 'Importance level not found.', None
 
-            if updated_importance:
-                return 'success', success_message, None
-            else:
-                # Join error messages
-                error_message = '; '.join(error_messages) if error_messages else 'Validation failed.'
-                return 'error', error_message, None
+        updated_importance, success_message, error_messages = importance.update_from_form(form_data)
 
-        except cls.DoesNotExist:
-            return 'error', 'Importance level not found.', None
-        except Exception:
-            return 'error', 'An error occurred while updating the importance level.', None
+        if updated_importance:
+            return 'success', success_message, None
+        else:
+            # Join error messages
+            error_message = '; '.join(error_messages) if error_messages else 'Validation failed.'
+            return 'error', error_message, None
 
     @classmethod
     def _handle_delete_action(cls, form_data):
@@ -187,19 +219,24 @@ class Importance(models.Model):
         if not importance_id:
             return 'error', 'No importance level specified for deletion.', None
 
-        try:
-            importance = get_object_or_404(cls, id=importance_id)
-            success, message = importance.delete_with_message()
+        importance = cls._get_for_action(importance_id)
+        if importance is None:
+            return 'error', 'Importance level not found.', None
 
-            if success:
-                return 'success', message, None
-            else:
-                return 'error', message, None
+        success, message = importance.delete_with_message()
 
-        except cls.DoesNotExist:
-            return 'error', 'Importance level not found.', None
-        except Exception:
-            return 'error', 'An error occurred while deleting the importance level.', None
+        if success:
+            return 'success', message, None
+        else:
+            return 'error', message, None
+
+    @classmethod
+    def _get_for_action(cls, importance_id):
+        """Return the importance level posted with an action, or None if there is no such level"""
+        try:
+            return cls.objects.filter(pk=importance_id).first()
+        except (ValueError, ValidationError):
+            return None  # Not a valid id
 
 
 class ScoreDay(BaseModel):
@@ -219,114 +256,188 @@ class ScoreDay(BaseModel):
 
     def calculate_scores(self):
         """Calculate and update daily scores from target categories"""
-        categories = self.categories.filter(is_deleted=False)
-
-        # Calculate scores for each category first
-        for category in categories:
-            category.calculate_scores()
-
-        # Calculate daily totals
-        totals = categories.aggregate(
-            total_score=models.Sum('score'),
-            total_max_score=models.Sum('max_score')
+        # Every category shares the same highest importance score, so look it up once
+        categories = self._score_categories(
+            self.categories.filter(is_deleted=False), Importance.get_max_score()
         )
 
-        self.score = totals['total_score'] or 0
-        self.max_score = totals['total_max_score'] or 0
+        # The categories were just scored in memory, so total them here
+        self.score = sum(category.score or 0 for category in categories)
+        self.max_score = sum(category.max_score or 0 for category in categories)
         # Save without triggering signals to prevent recursion
         self.save(update_fields=['score', 'max_score', 'updated_at'])
 
-    def get_normalized_score(self):
-        """Return display-friendly normalized score"""
-        if not self.max_score or self.max_score == 0:
-            return 0
+    @staticmethod
+    def _score_categories(categories, max_importance_score):
+        """
+        Score the given categories from one grouped query over their targets and
+        write them back in a single bulk update, rather than a SELECT and an
+        UPDATE per category. Returns the scored categories.
+        """
+        # Only the score columns are read or written here, so leave name,
+        # description and the other columns out of the rows (day stays
+        # loaded because bulk_update checks foreign keys before saving)
+        categories = list(
+            categories.only('day', 'score', 'max_score').annotate(
+                active_target_count=models.Count(
+                    'targets',
+                    filter=models.Q(targets__is_deleted=False)
+                ),
+                achieved_score=models.Sum(
+                    'targets__importance__score',
+                    filter=models.Q(targets__is_deleted=False, targets__is_achieved=True)
+                )
+            )
+        )
+        now = timezone.now()
+        for category in categories:
+            category.max_score = category.active_target_count * max_importance_score
+            category.score = category.achieved_score or 0
+            # bulk_update skips auto_now, so stamp updated_at as save() would
+            category.updated_at = now
+        if categories:
+            TargetCategory.objects.bulk_update(
+                categories, ['score', 'max_score', 'updated_at'], batch_size=1000
+            )
+        return categories
 
-        percentage = (self.score / self.max_score) * 100
+    @classmethod
+    def recalculate_scores_for_ids(cls, day_ids, batch_size=500):
+        """
+        Recalculate the days with the given ids and all of their categories.
+        Days are loaded and scored batch_size at a time, so the queries grow with
+        the number of batches rather than days and only one batch is in memory.
+        """
+        max_importance_score = None
+        for start in range(0, len(day_ids), batch_size):
+            days = list(
+                cls.objects.filter(pk__in=day_ids[start:start + batch_size]).only('score', 'max_score')
+            )
+            max_importance_score = cls._recalculate_batch(days, max_importance_score)
 
-        # Determine normalization factor based on score magnitude
-        if self.max_score >= 100:
-            factor = 100
-        else:
-            factor = 10
+    @classmethod
+    def _recalculate_batch(cls, days, max_importance_score):
+        """
+        Score one batch of days and their categories with grouped queries and
+        bulk updates. Returns the highest importance score used, looking it up
+        if it wasn't given.
+        """
+        if max_importance_score is None:
+            max_importance_score = Importance.get_max_score()
+
+        categories = cls._score_categories(
+            TargetCategory.objects.filter(day__in=days, is_deleted=False), max_importance_score
+        )
 
-        return round(percentage * factor / 100, 1)
+        totals = {day.pk: [0, 0] for day in days}
+        for category in categories:
+            day_totals = totals[category.day_id]
+            day_totals[0] += category.score
+            day_totals[1] += category.max_score
+
+        now = timezone.now()
+        for day in days:
+            day.score, day.max_score = totals[day.pk]
+            day.updated_at = now
+        cls.objects.bulk_update(days, ['score', 'max_score', 'updated_at'])
+        return max_importance_score
+
+    def get_normalized_score(self):
+        """Return display-friendly normalized score"""
+        return normalized_score(self.score, self.max_score)
 
     def get_display_score(self, baseline=10):
         """Return score multiplied by baseline for display purposes"""
-        if not self.max_score or self.max_score == 0:
-            return 0
-
-        percentage = (self.score / self.max_score)
-        return round(percentage * baseline, 1)
+        return display_score(self.score, self.max_score, baseline)
 
     def get_score_color_class(self):
         """Return Tailwind color class based on score percentage"""
-        if not self.max_score or self.max_score == 0:
-            return "text-zinc-500"
-
-        percentage = (self.score / self.max_score) * 100
-
-        if percentage >= 90:
-            return "text-green-400"
-        elif percentage >= 75:
-            return "text-green-500"
-        elif percentage >= 60:
-            return "text-yellow-400"
-        elif percentage >= 40:
-            return "text-orange-400"
-        elif percentage >= 20:
-            return "text-red-400"
-        else:
-            return "text-red-500"
+        return score_color_class(self.score, self.max_score)
 
     def copy_previous_day_categories(self):
         """Copy target categories from previous day"""
-        previous_day = ScoreDay.objects.filter(
+        # Only the id is needed to find the categories to copy
+        previous_day_id = ScoreDay.objects.filter(
             day__lt=self.day,
             is_deleted=False
-        ).order_by('-day').first()
+        ).order_by('-day').values_list('pk', flat=True).first()
 
-        if not previous_day:
+        if previous_day_id is None:
             return
 
-        previous_categories = previous_day.categories.filter(is_deleted=False)
-
-        for prev_category in previous_categories:
-            # Create new category for current day
-            new_category = TargetCategory.objects.create(
-                day=self,
-                name=prev_category.name,
-                description=prev_category.description,
-                score=None,
-                max_score=None
-            )
+        previous_categories = TargetCategory.objects.filter(
+            day_id=previous_day_id,
+            is_deleted=False
+        ).prefetch_related(
+            # The copies are listed by the default ordering anyway, so skip it here
+            # rather than joining importance just to sort the originals
+            models.Prefetch('targets', queryset=Target.objects.filter(is_deleted=False).order_by())
+        )
 
-            # Copy targets from previous category
-            prev_targets = prev_category.targets.filter(is_deleted=False)
-            for prev_target in prev_targets:
-                Target.objects.create(
-                    name=prev_target.name,
-                    category=new_category,
-                    importance=prev_target.importance,
-                    is_achieved=False  # Reset achievement status
+        # TargetCategory and Target inherit from a concrete BaseModel, so bulk_create
+        # is not available; commit the inserts together instead and let the day be
+        # rescored once at the end rather than after every copied target
+        with transaction.atomic(), coalesce_recalculations():
+            for prev_category in previous_categories:
+                # Create new category for current day
+                new_category = TargetCategory.objects.create(
+                    day=self,
+                    name=prev_category.name,
+                    description=prev_category.description,
+                    score=None,
+                    max_score=None
                 )
 
-    def get_yesterday_change(self):
-        """Calculate percentage change compared to yesterday"""
+                # Copy targets from previous category
+                for prev_target in prev_category.targets.all():
+                    Target.objects.create(
+                        name=prev_target.name,
+                        category=new_category,
+                        importance_id=prev_target.importance_id,
+                        is_achieved=False  # Reset achievement status
+                    )
+
+    @classmethod
+    def with_yesterday_change(cls):
+        """
+        Return active days annotated with the preceding day's scores, so listings
+        can show each day's change without a query per day.
+        """
+        preceding = {'order_by': models.F('day').asc()}
+        return cls.objects.filter(is_deleted=False).annotate(
+            preceding_day=models.Window(Lag('day'), **preceding),
+            preceding_score=models.Window(Lag('score'), **preceding),
+            preceding_max_score=models.Window(Lag('max_score'), **preceding),
+        )
+
+    def get_yesterday_change(self, yesterday=None):
+        """
+        Calculate percentage change compared to yesterday.
+        Uses the annotations from with_yesterday_change() or a yesterday ScoreDay
+        the caller already fetched when available, otherwise looks yesterday up.
+        """
         from datetime import timedelta
 
         yesterday_date = self.day - timedelta(days=1)
-        try:
-            yesterday = ScoreDay.objects.get(day=yesterday_date, is_deleted=False)
-
-            # Calculate percentage change
-            if yesterday.max_score and yesterday.max_score > 0 and self.max_score and self.max_score > 0:
-                yesterday_percentage = (yesterday.score / yesterday.max_score) * 100
-                today_percentage = (self.score / self.max_score) * 100
-                return today_percentage - yesterday_percentage
 
-        except ScoreDay.DoesNotExist:
-            pass
+        if hasattr(self, 'preceding_day'):
+            # The preceding row is only yesterday if no day was skipped
+            if self.preceding_day != yesterday_date:
+                return None
+            yesterday_score, yesterday_max_score = self.preceding_score, self.preceding_max_score
+        else:
+            if yesterday is None:
+                try:
+                    yesterday = ScoreDay.objects.get(day=yesterday_date, is_deleted=False)
+                except ScoreDay.DoesNotExist:
+                    return None
+            yesterday_score, yesterday_max_score = yesterday.score, yesterday.max_score
+
+        # Calculate percentage change
+        if yesterday_max_score and yesterday_max_score > 0 and self.max_score and self.max_score > 0:
+            yesterday_percentage = (yesterday_score / yesterday_max_score) * 100
+            today_percentage = (self.score / self.max_score) * 100
+            return today_percentage - yesterday_percentage
 
         return None
 
@@ -352,14 +463,30 @@ class ScoreDay(BaseModel):
         """Check if wake time is set"""
         return self.wake_time is not None
 
+    def _get_adjacent_days(self):
+        """
+        Return the (previous, next) ScoreDays, fetched together in one query and
+        kept on the instance, since a dashboard render asks for both more than once.
+        """
+        if not hasattr(self, '_adjacent_days'):
+            from datetime import timedelta
+            previous_date = self.day - timedelta(days=1)
+            next_date = self.day + timedelta(days=1)
+
+            adjacent = {
+                score_day.day: score_day
+                for score_day in ScoreDay.objects.filter(
+                    day__in=[previous_date, next_date],
+                    is_deleted=False
+                )
+            }
+            self._adjacent_days = (adjacent.get(previous_date), adjacent.get(next_date))
+
+        return self._adjacent_days
+
     def get_previous_day(self):
         """Get the previous ScoreDay if it exists"""
-        from datetime import timedelta
-        previous_date = self.day - timedelta(days=1)
-        return ScoreDay.objects.filter(
-            day=previous_date,
-            is_deleted=False
-        ).first()
+        return self._get_adjacent_days()[0]
 
     def get_next_day(self):
         """Get the next ScoreDay if it exists and is not in the future"""
@@ -370,23 +497,33 @@ class ScoreDay(BaseModel):
         if next_date > timezone.now().date():
             return None
 
-        return ScoreDay.objects.filter(
-            day=next_date,
-            is_deleted=False
-        ).first()
+        return self._get_adjacent_days()[1]
 
     @classmethod
     def get_or_create_today(cls):
         """Get or create ScoreDay for today"""
         today = timezone.now().date()
-        score_day, created = cls.objects.get_or_create(
-            day=today,
-            defaults={'score': None, 'max_score': None}
-        )
 
-        if created:
-            score_day.copy_previous_day_categories()
-            score_day.calculate_scores()
+        # Every request after the first of the day only needs this single lookup
+        try:
+            return cls.objects.get(day=today)
+        except cls.DoesNotExist:
+            pass
+
+        # Create and seed the day in one transaction, so a concurrent request that
+        # loses the insert race waits on the unique day and then reads the seeded
+        # day instead of an empty one
+        with transaction.atomic():
+            score_day, created = cls.objects.get_or_create(
+                day=today,
+                defaults={'score': None, 'max_score': None}
+            )
+
+            if created:
+                # Each copied category and target would otherwise rescore the day
+                with coalesce_recalculations():
+                    score_day.copy_previous_day_categories()
+                    recalculate_day(score_day)
 
         return score_day
 
@@ -397,36 +534,68 @@ class ScoreDay(BaseModel):
         if sleep_wake_form is None:
             sleep_wake_form = SleepWakeTimeForm(instance=self)
 
-        # Get yesterday's data
+        # Get yesterday's data, with its categories fetched once and keyed by name
+        # so each of today's categories can find its counterpart without a query
         yesterday_day = self.get_previous_day()
+        yesterday_category_list = []
+        if yesterday_day:
+            # Only the columns the comparison and the yesterday summary read, with
+            # the summary's target counts grouped into the same query
+            yesterday_category_list = list(
+                yesterday_day.categories.filter(is_deleted=False)
+                .only('day', 'name', 'score', 'max_score')
+                .annotate(
+                    active_target_count=models.Count(
+                        'targets',
+                        filter=models.Q(targets__is_deleted=False)
+                    ),
+                    achieved_target_count=models.Count(
+                        'targets',
+                        filter=models.Q(targets__is_deleted=False, targets__is_achieved=True)
+                    ),
+                )
+                .order_by('name')
+            )
+        yesterday_categories_by_name = {
+            category.name: category for category in yesterday_category_list
+        }
 
-        # Get categories with optimized queries
-        categories = self.categories.filter(is_deleted=False).prefetch_related(
-            'targets__importance'
-        ).order_by('name')
+        # Load categories with their active targets (and importance) up front,
+        # so the loop below counts from in-memory lists instead of querying.
+        # The dashboard never shows the BaseModel timestamps, so leave them out
+        categories = list(
+            self.categories.filter(is_deleted=False).defer('created_at', 'updated_at').prefetch_related(
+                models.Prefetch(
+                    'targets',
+                    queryset=Target.objects.filter(is_deleted=False)
+                    .defer('created_at', 'updated_at')
+                    .select_related('importance'),
+                    to_attr='active_targets'
+                )
+            ).order_by('name')
+        )
 
         # Prepare categories data
         categories_data = []
         for category in categories:
-            targets = category.targets.filter(is_deleted=False).order_by('-importance__score', 'name')
-            category.yesterday_change = category.get_yesterday_change()
+            targets = category.active_targets
+            category.yesterday_change = category.get_yesterday_change(yesterday_categories_by_name)
             categories_data.append({
                 'category': category,
                 'targets': targets,
-                'achieved_count': targets.filter(is_achieved=True).count(),
-                'total_count': targets.count(),
+                'achieved_count': sum(1 for target in targets if target.is_achieved),
+                'total_count': len(targets),
                 'normalized_score': category.get_normalized_score()
             })
 
         # Prepare yesterday's categories data
         yesterday_categories = []
         if yesterday_day:
-            for category in yesterday_day.categories.filter(is_deleted=False).order_by('name'):
+            for category in yesterday_category_list:
                 yesterday_categories.append({
                     'category': category,
-                    'targets': category.targets.filter(is_deleted=False),
-                    'achieved_count': category.targets.filter(is_deleted=False, is_achieved=True).count(),
-                    'total_count': category.targets.filter(is_deleted=False).count(),
+                    'achieved_count': category.achieved_target_count,
+                    'total_count': category.active_target_count,
                 })
 
         # Calculate progress percentage
@@ -434,7 +603,13 @@ class ScoreDay(BaseModel):
         if self.max_score and self.max_score > 0:
             progress_percentage = round((self.score / self.max_score) * 100, 1)
 
-        self.yesterday_change = self.get_yesterday_change()
+        # Reuse the yesterday row fetched above rather than looking it up again
+        self.yesterday_change = self.get_yesterday_change(yesterday_day) if yesterday_day else None
+
+        from .cache import get_importances
+
+        # Cached and ordered by score, highest first; also covers the has-levels flag
+        importance_levels = get_importances()
 
         return {
             'current_day': self,
@@ -443,9 +618,9 @@ class ScoreDay(BaseModel):
             'yesterday_categories': yesterday_categories,
             'progress_percentage': progress_percentage,
             'normalized_daily_score': self.get_normalized_score(),
-            'importance_levels': Importance.objects.all().order_by('-score'),
-            'has_categories': categories.exists(),
-            'has_importance_levels': Importance.objects.exists(),
+            'importance_levels': importance_levels,
+            'has_categories': bool(categories),
+            'has_importance_levels': bool(importance_levels),
             'sleep_wake_form': sleep_wake_form,
             'is_first_day': yesterday_day is None,
             'has_yesterday_data': yesterday_day is not None and yesterday_categories,
@@ -461,79 +636,68 @@ class TargetCategory(BaseModel):
     max_score = models.PositiveIntegerField(null=True, blank=True)
 
     class Meta:
-        unique_together = ['day', 'name']
         ordering = ['name']
+        indexes = [
+            # A day's categories are listed in name order on every page; the unique
+            # constraint is on lower(name) first, so it can't serve that
+            models.Index(fields=['day', 'name'], name='category_day_name_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                Lower('name'), 'day',
+                name='unique_category_name_per_day',
+                violation_error_message='A category with this name already exists for this day.',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.day.day})"
 
     def calculate_scores(self):
         """Calculate category scores from targets"""
-        targets = self.targets.filter(is_deleted=False)
+        # Count the targets and sum the achieved importance scores in one query
+        totals = self.targets.filter(is_deleted=False).aggregate(
+            target_count=models.Count('id'),
+            achieved_score=models.Sum('importance__score', filter=models.Q(is_achieved=True))
+        )
 
         # Calculate max score: number of targets × highest importance score
-        target_count = targets.count()
-        max_importance_score = Importance.get_max_score()
-        self.max_score = target_count * max_importance_score
+        self.max_score = totals['target_count'] * Importance.get_max_score()
 
         # Calculate actual score: sum of achieved targets' importance scores
-        achieved_targets = targets.filter(is_achieved=True)
-        self.score = sum(target.importance.score for target in achieved_targets)
+        self.score = totals['achieved_score'] or 0
 
-        # Save without triggering signals to prevent recursion
+        # A score-only update_fields tells the post_save handler not to rescore the day
         self.save(update_fields=['score', 'max_score', 'updated_at'])
 
     def get_normalized_score(self):
         """Return display-friendly normalized score"""
-        if not self.max_score or self.max_score == 0:
-            return 0
-
-        percentage = (self.score / self.max_score) * 100
-
-        # Determine normalization factor based on score magnitude
-        if self.max_score >= 100:
-            factor = 100
-        else:
-            factor = 10
-
-        return round(percentage * factor / 100, 1)
+        return normalized_score(self.score, self.max_score)
 
     def get_display_score(self, baseline=10):
         """Return score multiplied by baseline for display purposes"""
-        if not self.max_score or self.max_score == 0:
-            return 0
-
-        percentage = (self.score / self.max_score)
-        return round(percentage * baseline, 1)
+        return display_score(self.score, self.max_score, baseline)
 
     def get_score_color_class(self):
         """Return Tailwind color class based on score percentage"""
-        if not self.max_score or self.max_score == 0:
-            return "text-zinc-500"
-
-        percentage = (self.score / self.max_score) * 100
-
-        if percentage >= 90:
-            return "text-green-400"
-        elif percentage >= 75:
-            return "text-green-500"
-        elif percentage >= 60:
-            return "text-yellow-400"
-        elif percentage >= 40:
-            return "text-orange-400"
-        elif percentage >= 20:
-            return "text-red-400"
-        else:
-            return "text-red-500"
+        return score_color_class(self.score, self.max_score)
 
-    def get_yesterday_change(self):
-        """Calculate percentage change compared to yesterday's same category"""
+    def get_yesterday_change(self, yesterday_categories=None):
+        """
+        Calculate percentage change compared to yesterday's same category.
+        Pass yesterday's active categories keyed by name to avoid querying for them.
+        """
         from datetime import timedelta
 
-        yesterday_date = self.day.day - timedelta(days=1)
         try:
-            yesterday_day = ScoreDay.objects.get(day=yesterday_date, is_deleted=False)
-            yesterday_category = yesterday_day.categories.get(name=self.name, is_deleted=False)
+            if yesterday_categories is not None:
+                yesterday_category = yesterday_categories.get(self.name)
+                if yesterday_category is None:
+                    return None
+            else:
+                yesterday_date = self.day.day - timedelta(days=1)
+                yesterday_day = ScoreDay.objects.get(day=yesterday_date, is_deleted=False)
+                yesterday_category = yesterday_day.categories.get(name=self.name, is_deleted=False)
 
             # Calculate percentage change
             if (yesterday_category.max_score and yesterday_category.max_score > 0 and
@@ -552,7 +716,7 @@ class TargetCategory(BaseModel):
         """Get category for today with proper validation"""
         current_day = ScoreDay.get_or_create_today()
         return get_object_or_404(
-            cls,
+            cls.objects.select_related('day'),
             pk=pk,
             day=current_day,
             is_deleted=False
@@ -579,9 +743,13 @@ class TargetCategory(BaseModel):
         form = TargetCategoryForm(form_data, instance=self, current_day=self.day)
 
         if form.is_valid():
-            updated_category = form.save()
-            success_message = f'Category "{updated_category.name}" has been updated successfully.'
-            return updated_category, success_message, None
+            try:
+                updated_category = form.save()
+            except ValidationError:
+                pass  # Duplicate name for the day, the form now carries the error
+            else:
+                success_message = f'Category "{updated_category.name}" has been updated successfully.'
+                return updated_category, success_message, None
 
         # Form has errors - return context for re-rendering
         context = {
@@ -607,16 +775,39 @@ class TargetCategory(BaseModel):
     def soft_delete_with_targets(self):
         """Soft delete category and all its targets"""
         category_name = self.name
-
-        # Soft delete the category
-        self.is_deleted = True
-        self.save()
-
-        # Soft delete all associated targets
-        self.targets.filter(is_deleted=False).update(is_deleted=True)
-
-        # Recalculate scores after deletion
-        self.day.calculate_scores()
+        now = timezone.now()
+
+        with transaction.atomic():
+            # Soft delete the category; update() skips post_save, so the day
+            # total is adjusted below instead of being recalculated
+            deleted = TargetCategory.objects.filter(pk=self.pk, is_deleted=False).update(
+                is_deleted=True,
+                updated_at=now
+            )
+            self.is_deleted = True
+
+            # Soft delete all associated targets
+            self.targets.filter(is_deleted=False).update(is_deleted=True, updated_at=now)
+
+            # The day total is the sum of its active categories, so removing this
+            # one only takes its stored scores off the day. They are read in SQL,
+            # since this instance may be stale; if they are missing or exceed the
+            # day's, the stored totals have drifted and the day is rescored instead
+            if deleted:
+                stored = TargetCategory.objects.filter(pk=self.pk)
+                category_score = models.Subquery(stored.values('score')[:1])
+                category_max_score = models.Subquery(stored.values('max_score')[:1])
+                shifted = ScoreDay.objects.filter(
+                    pk=self.day_id,
+                    score__gte=category_score,
+                    max_score__gte=category_max_score,
+                ).update(
+                    score=models.F('score') - category_score,
+                    max_score=models.F('max_score') - category_max_score,
+                    updated_at=now
+                )
+                if not shifted:
+                    recalculate_day(ScoreDay(pk=self.day_id))
 
         success_message = f'Category "{category_name}" and all its targets have been removed successfully.'
         return success_message
@@ -633,18 +824,51 @@ class Target(BaseModel):
 
     class Meta:
         ordering = ['-importance__score', 'name']
+        indexes = [
+            # Scoring filters a category's targets by achievement; is_deleted lives
+            # on the BaseModel parent table, so it cannot be part of this index
+            models.Index(fields=['category', 'is_achieved'], name='target_category_achieved_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.category.name})"
 
     def toggle_achievement(self):
-        """Toggle achievement status and trigger recalculation"""
-        self.is_achieved = not self.is_achieved
-        self.save()
+        """Toggle achievement status and update the category and day scores"""
+        with transaction.atomic():
+            # Flip the stored value in SQL so concurrent toggles can't overwrite each
+            # other; update() skips post_save, so the scores are recalculated below
+            Target.objects.filter(pk=self.pk).update(
+                is_achieved=~models.F('is_achieved'),
+                updated_at=timezone.now()
+            )
+            self.refresh_from_db(fields=['is_achieved', 'updated_at'])
+
+            # Deleted targets and categories don't count towards the scores above them
+            if self.is_deleted:
+                return
+            category = self.category
+
+            # A toggle only moves this target's points in or out of the achieved
+            # score (max_score is unchanged), so shift the stored totals instead of
+            # recalculating every category of the day. A missing total, or one too
+            # small to take the points off, has drifted and is recalculated instead
+            delta = self.importance.score if self.is_achieved else -self.importance.score
+            in_step = {'score__isnull': False} if delta > 0 else {'score__gte': -delta}
+            shift = {'score': models.F('score') + delta, 'updated_at': timezone.now()}
+            if TargetCategory.objects.filter(pk=category.pk, **in_step).update(**shift):
+                category.score = (category.score or 0) + delta
+            else:
+                category.calculate_scores()
+            if category.is_deleted:
+                return
 
-        # Trigger recalculation of category and day scores
-        self.category.calculate_scores()
-        self.category.day.calculate_scores()
+            if ScoreDay.objects.filter(pk=category.day_id, **in_step).update(**shift):
+                if TargetCategory.day.is_cached(category):
+                    category.day.score = (category.day.score or 0) + delta
+            else:
+                day = category.day if TargetCategory.day.is_cached(category) else ScoreDay(pk=category.day_id)
+                day.calculate_scores()
 
     def get_achievement_message(self):
         """Get success message for achievement toggle"""
@@ -666,28 +890,34 @@ class Target(BaseModel):
         """Get context data for target creation form"""
         from .forms import TargetForm
 
-        # Handle initial category selection
+        from .cache import get_importances
+
+        # Fetch the choices once; the form renders its selects from these lists
+        categories = list(current_day.categories.filter(is_deleted=False).order_by('name'))
+        importance_levels = get_importances()
+
+        # Handle initial category selection (invalid category IDs are ignored)
         initial = {}
         if category_id:
-            try:
-                category = TargetCategory.objects.get(
-                    id=category_id,
-                    day=current_day,
-                    is_deleted=False
-                )
-                initial['category'] = category
-            except TargetCategory.DoesNotExist:
-                pass  # Invalid category ID, ignore
-
-        form = TargetForm(initial=initial, current_day=current_day)
+            for category in categories:
+                if str(category.pk) == str(category_id):
+                    initial['category'] = category
+                    break
+
+        form = TargetForm(
+            initial=initial,
+            current_day=current_day,
+            categories=categories,
+            importance_levels=importance_levels
+        )
 
         return {
             'form': form,
             'page_title': 'Create New Target',
             'submit_text': 'Create Target',
             'current_day': current_day,
-            'categories_count': current_day.categories.filter(is_deleted=False).count(),
-            'importance_levels': Importance.objects.all().order_by('-score')
+            'categories_count': len(categories),
+            'importance_levels': importance_levels
         }
 
     @classmethod
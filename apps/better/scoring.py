@@ -0,0 +1,116 @@
+import threading
+from bisect import bisect_right
+from contextlib import contextmanager
+
+# Per-thread recalculation state: how many coalesce blocks are open and the
+# categories/days whose scores were requested inside them, keyed by pk
+_state = threading.local()
+
+
+def is_coalescing():
+    """Return whether recalculations are currently being deferred to the end of a block"""
+    return getattr(_state, 'depth', 0) > 0
+
+
+@contextmanager
+def coalesce_recalculations():
+    """
+    Defer score recalculations requested inside the block and run each
+    category and day once when the outermost block exits.
+    Nested blocks join the outer one; pending work is dropped on error.
+    """
+    if not is_coalescing():
+        _state.depth = 0
+        _state.pending_categories = {}
+        _state.pending_days = {}
+
+    _state.depth += 1
+    try:
+        yield
+    except BaseException:
+        _state.depth -= 1
+        if _state.depth == 0:
+            _state.pending_categories = {}
+            _state.pending_days = {}
+        raise
+
+    _state.depth -= 1
+    if _state.depth > 0:
+        return
+
+    pending_categories, _state.pending_categories = _state.pending_categories, {}
+    pending_days, _state.pending_days = _state.pending_days, {}
+
+    # Categories first, so the day totals see their updated scores. A day
+    # rescores its active categories itself, so those are left to it
+    for category in pending_categories.values():
+        if category.day_id in pending_days and not category.is_deleted:
+            continue
+        category.calculate_scores()
+    for day in pending_days.values():
+        day.calculate_scores()
+
+
+def recalculate_category(category):
+    """Recalculate a category's scores now, or once at the end of the coalesce block"""
+    if is_coalescing():
+        _state.pending_categories.setdefault(category.pk, category)
+    else:
+        category.calculate_scores()
+
+
+def recalculate_day(day):
+    """Recalculate a day's scores now, or once at the end of the coalesce block"""
+    if is_coalescing():
+        _state.pending_days.setdefault(day.pk, day)
+    else:
+        day.calculate_scores()
+
+
+# Lower bounds (in percent) of each color band; a score at or above a bound
+# takes the class after it, so SCORE_COLOR_CLASSES has one more entry
+SCORE_COLOR_THRESHOLDS = (20, 40, 60, 75, 90)
+SCORE_COLOR_CLASSES = (
+    "text-red-500",
+    "text-red-400",
+    "text-orange-400",
+    "text-yellow-400",
+    "text-green-500",
+    "text-green-400",
+)
+
+
+def normalized_score(score, max_score):
+    """Return a display-friendly normalized score for a score out of max_score"""
+    if not max_score:
+        return 0
+
+    percentage = (score / max_score) * 100
+
+    # Determine normalization factor based on score magnitude
+    if max_score >= 100:
+        factor = 100
+    else:
+        factor = 10
+
+    return round(percentage * factor / 100, 1)
+
+
+def display_score(score, max_score, baseline=10):
+    """Return the score as a fraction of max_score multiplied by baseline"""
+    if not max_score:
+        return 0
+
+    percentage = (score / max_score)
+    return round(percentage * baseline, 1)
+
+
+def score_color_class(score, max_score):
+    """Return the Tailwind color class for a score out of max_score"""
+    if not max_score:
+        return "text-zinc-500"
+
+    # The thresholds are whole percentages, so flooring the percentage in integer
+    # math picks the same band as the exact float value
+    percentage = (score or 0) * 100 // max_score
+    return SCORE_COLOR_CLASSES[bisect_right(SCORE_COLOR_THRESHOLDS, percentage)]
@@ -1,93 +1,224 @@
-from django.db.models.signals import post_delete, post_save
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
+from apps.better.cache import invalidate_importances
 from apps.better.models import TargetCategory, ScoreDay, Importance, Target
+from apps.better.scoring import is_coalescing, recalculate_category, recalculate_day
+
+# Fields written by TargetCategory.calculate_scores()
+CATEGORY_SCORE_FIELDS = {'score', 'max_score', 'updated_at'}
+
+
+def _day_of(category):
+    """
+    Return the category's day for rescoring. Scoring a day only needs its id, so
+    reuse the day the category already holds or skip loading it.
+    """
+    if TargetCategory.day.is_cached(category):
+        return category.day
+    return ScoreDay(pk=category.day_id)
+
+
+def _add_to_max_scores(category_id, points):
+    """Add points to the max score of a category and, if the category is active, its day"""
+    # Scores are NULL until first calculated, so count them from zero
+    now = timezone.now()
+    TargetCategory.objects.filter(pk=category_id).update(
+        score=Coalesce(F('score'), 0),
+        max_score=Coalesce(F('max_score'), 0) + points,
+        updated_at=now
+    )
+    ScoreDay.objects.filter(categories=category_id, categories__is_deleted=False).update(
+        score=Coalesce(F('score'), 0),
+        max_score=Coalesce(F('max_score'), 0) + points,
+        updated_at=now
+    )
 
 
-@receiver(post_save, sender=Target)
+@receiver(post_save, sender=Target, dispatch_uid='better.target_post_save_handler')
 def target_post_save_handler(sender, instance, created, **kwargs):
     """
     Signal handler for Target model post_save.
     Triggers score recalculation when targets are created or updated.
     Requirements: 8.1, 8.2
     """
+    # A new target that isn't achieved only adds its possible points, so shift
+    # the max scores rather than recalculating (unless a batch will anyway)
+    if created and not instance.is_deleted and not instance.is_achieved and not is_coalescing():
+        _add_to_max_scores(instance.category_id, Importance.get_max_score())
+        return
+
     # Only recalculate if the target is not deleted
     if not instance.is_deleted:
         # Recalculate category scores
-        instance.category.calculate_scores()
+        recalculate_category(instance.category)
         # Recalculate day scores
-        instance.category.day.calculate_scores()
+        recalculate_day(_day_of(instance.category))
 
 
-@receiver(post_delete, sender=Target)
+@receiver(post_delete, sender=Target, dispatch_uid='better.target_post_delete_handler')
 def target_post_delete_handler(sender, instance, **kwargs):
     """
     Signal handler for Target model post_delete.
     Triggers score recalculation when targets are deleted.
     Requirements: 8.1, 8.2
     """
-    # Recalculate category and day scores after target deletion
+    # Recalculate category and day scores after target deletion. Scoring only
+    # needs the ids, so look up the day id rather than loading both rows
     if instance.category_id:
-        try:
-            category = TargetCategory.objects.get(id=instance.category_id)
-            category.calculate_scores()
-            category.day.calculate_scores()
-        except TargetCategory.DoesNotExist:
-            pass
+        day_id = TargetCategory.objects.filter(
+            pk=instance.category_id
+        ).values_list('day_id', flat=True).first()
+        if day_id is None:
+            return  # The category was deleted along with the target
+
+        recalculate_category(TargetCategory(pk=instance.category_id, day_id=day_id))
+        recalculate_day(ScoreDay(pk=day_id))
+
+
+def _recalculate_days_using_importance(importance, max_score_changed):
+    """
+    Recalculate only the days whose scores depend on the given importance level.
+    A new highest score changes the max score of every day with active targets;
+    otherwise only days with active targets at this importance level are affected.
+    """
+    target_filter = {
+        'categories__is_deleted': False,
+        'categories__targets__is_deleted': False,
+    }
+    if not max_score_changed:
+        target_filter['categories__targets__importance'] = importance
 
+    # Collect the ids up front so no cursor is open while the batches are
+    # written, then load and score the days a batch at a time
+    day_ids = list(
+        ScoreDay.objects.filter(is_deleted=False, **target_filter).distinct()
+        .values_list('pk', flat=True)
+    )
+    ScoreDay.recalculate_scores_for_ids(day_ids)
 
-@receiver(post_save, sender=Importance)
+
+@receiver(pre_save, sender=Importance, dispatch_uid='better.importance_pre_save_handler')
+def importance_pre_save_handler(sender, instance, **kwargs):
+    """
+    Signal handler for Importance model pre_save.
+    Records the stored score and the highest score before the change,
+    so post_save can tell which days need recalculating.
+    """
+    # A save that doesn't write the score can't change any day's scores
+    update_fields = kwargs.get('update_fields')
+    instance._score_unchanged = update_fields is not None and 'score' not in update_fields
+    if instance._score_unchanged:
+        return
+
+    instance._previous_score = (
+        Importance.objects.filter(pk=instance.pk).values_list('score', flat=True).first()
+        if instance.pk else None
+    )
+    # Compare against the stored levels, not a cached score another
+    # process may be about to replace
+    invalidate_importances()
+    instance._previous_max_score = Importance.get_max_score()
+
+
+@receiver(post_save, sender=Importance, dispatch_uid='better.importance_post_save_handler')
 def importance_post_save_handler(sender, instance, created, **kwargs):
     """
     Signal handler for Importance model post_save.
-    Triggers global recalculation when importance levels are modified.
+    Triggers recalculation of the days affected by the changed importance level.
     Requirements: 3.5, 8.1, 8.3
     """
-    # Recalculate all scores across all days when importance levels change
-    for score_day in ScoreDay.objects.filter(is_deleted=False):
-        score_day.calculate_scores()
+    # Drop cached importance levels now and again once the change is committed,
+    # so a concurrent read cannot re-cache the old rows
+    invalidate_importances()
+    transaction.on_commit(invalidate_importances)
+
+    # A label-only edit leaves every score as it was
+    if getattr(instance, '_score_unchanged', False):
+        return
+    previous_score = getattr(instance, '_previous_score', None)
+    if not created and previous_score == instance.score:
+        return
 
+    max_score_changed = (
+        Importance.get_max_score() != getattr(instance, '_previous_max_score', None)
+    )
+    _recalculate_days_using_importance(instance, max_score_changed)
 
-@receiver(post_delete, sender=Importance)
+
+@receiver(post_delete, sender=Importance, dispatch_uid='better.importance_post_delete_handler')
 def importance_post_delete_handler(sender, instance, **kwargs):
     """
     Signal handler for Importance model post_delete.
-    Triggers global recalculation when importance levels are deleted.
+    Triggers recalculation of the days affected by the deleted importance level.
     Requirements: 3.5, 8.1, 8.3
     """
-    # Recalculate all scores across all days when importance levels are deleted
-    for score_day in ScoreDay.objects.filter(is_deleted=False):
-        score_day.calculate_scores()
+    invalidate_importances()
+    transaction.on_commit(invalidate_importances)
+
+    # Targets at this level were deleted with it and rescored their own days,
+    # so other days only change if this was the highest score
+    if instance.score > Importance.get_max_score():
+        _recalculate_days_using_importance(instance, max_score_changed=True)
 
 
-@receiver(post_save, sender=TargetCategory)
+@receiver(post_save, sender=TargetCategory, dispatch_uid='better.target_category_post_save_handler')
 def target_category_post_save_handler(sender, instance, created, **kwargs):
     """
     Signal handler for TargetCategory model post_save.
     Triggers day score recalculation when categories are modified.
     Requirements: 8.2, 8.3
     """
-    # Only recalculate if the category is not deleted and this isn't a score update
+    # Score-only writes come from a recalculation already in progress
     update_fields = kwargs.get('update_fields')
-    if not instance.is_deleted and not update_fields:
-        # Recalculate day scores when category is modified
-        instance.day.calculate_scores()
-    elif instance.is_deleted:
-        # If category is being marked as deleted, recalculate to exclude it
-        instance.day.calculate_scores()
+    if update_fields and set(update_fields) <= CATEGORY_SCORE_FIELDS:
+        return
 
+    # Recalculate day scores when the category is modified, or when it is marked
+    # as deleted so the day total excludes it
+    if instance.is_deleted or not update_fields:
+        recalculate_day(_day_of(instance))
 
-@receiver(post_delete, sender=TargetCategory)
+
+@receiver(post_delete, sender=TargetCategory, dispatch_uid='better.target_category_post_delete_handler')
 def target_category_post_delete_handler(sender, instance, **kwargs):
     """
     Signal handler for TargetCategory model post_delete.
     Triggers day score recalculation when categories are deleted.
     Requirements: 8.2, 8.3
     """
-    # Recalculate day scores after category deletion
+    # Recalculate day scores after category deletion; scoring only needs the day's id.
+    # Deleting a day removes its categories first, so the day row still exists here
     if instance.day_id:
-        try:
-            day = ScoreDay.objects.get(id=instance.day_id)
-            day.calculate_scores()
-        except ScoreDay.DoesNotExist:
-            pass
+        recalculate_day(ScoreDay(pk=instance.day_id))
+
+
+# The receivers above that keep stored scores in step with targets and categories
+SCORE_RECEIVERS = [
+    (post_save, Target, target_post_save_handler, 'better.target_post_save_handler'),
+    (post_delete, Target, target_post_delete_handler, 'better.target_post_delete_handler'),
+    (post_save, TargetCategory, target_category_post_save_handler, 'better.target_category_post_save_handler'),
+    (post_delete, TargetCategory, target_category_post_delete_handler, 'better.target_category_post_delete_handler'),
+]
+
+
+@contextmanager
+def suspend_score_signals():
+    """
+    Disconnect the score recalculation receivers inside the block, e.g. while
+    creating test fixtures. Stored scores are not updated for changes made in it.
+    The importance receivers stay connected, since they also invalidate the cache.
+    """
+    for signal, sender, _handler, dispatch_uid in SCORE_RECEIVERS:
+        signal.disconnect(sender=sender, dispatch_uid=dispatch_uid)
+    try:
+        yield
+    finally:
+        for signal, sender, handler, dispatch_uid in SCORE_RECEIVERS:
+            signal.connect(handler, sender=sender, dispatch_uid=dispatch_uid)
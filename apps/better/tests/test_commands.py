@@ -0,0 +1,52 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from datetime import date, timedelta
+
+from ..management.commands.add_default_categories import Command
+from ..models import ScoreDay, TargetCategory
+from ..signals import suspend_score_signals
+
+
+class AddDefaultCategoriesCommandTests(TestCase):
+    """Test the add_default_categories management command"""
+    
+    def delete_empty_categories(self, day, count):
+        """Create count empty categories on day and delete them, returning the queries run"""
+        with suspend_score_signals():
+            for index in range(count):
+                TargetCategory.objects.create(day=day, name=f'Empty {index}')
+        
+        command = Command(stdout=StringIO())
+        with CaptureQueriesContext(connection) as queries:
+            deleted = command.delete_empty_categories(day)
+        
+        self.assertEqual(deleted, count)
+        self.assertFalse(TargetCategory.objects.filter(day=day).exists())
+        return queries
+    
+    def test_delete_empty_categories_rescores_day_once(self):
+        """Test that deleting empty categories costs the same queries however many there are"""
+        two_categories = self.delete_empty_categories(ScoreDay.objects.create(day=date.today()), 2)
+        ten_categories = self.delete_empty_categories(
+            ScoreDay.objects.create(day=date.today() - timedelta(days=1)), 10
+        )
+        
+        self.assertEqual(len(ten_categories), len(two_categories))
+    
+    def test_existing_category_in_other_case_is_overwritten_not_duplicated(self):
+        """Test that a day's "health" counts as the default "Health" category"""
+        day = ScoreDay.objects.create(day=date.today())
+        with suspend_score_signals():
+            TargetCategory.objects.create(day=day, name='health', description='Old')
+        
+        out = StringIO()
+        call_command('add_default_categories', '--overwrite', date=day.day.isoformat(), stdout=out)
+        
+        self.assertNotIn('Error adding category', out.getvalue())
+        health = TargetCategory.objects.get(day=day, name__iexact='health')
+        self.assertEqual(health.name, 'health')
+        self.assertNotEqual(health.description, 'Old')
@@ -1,16 +1,22 @@
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from datetime import date, timedelta
+from unittest.mock import patch
 
 from ..models import ScoreDay, TargetCategory, Target, Importance
 from ..forms import TargetCategoryForm, TargetForm, TargetAchievementForm, ImportanceForm, SleepWakeTimeForm
+from ..signals import suspend_score_signals
 
 
 class TargetCategoryFormTests(TestCase):
     """Test TargetCategoryForm validation and functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.current_day = ScoreDay.objects.create(day=date.today())
+        cls.current_day = ScoreDay.objects.create(day=date.today())
     
     def test_valid_form_data(self):
         """Test form with valid data"""
@@ -48,10 +54,11 @@ class TargetCategoryFormTests(TestCase):
     def test_form_with_duplicate_name_same_day(self):
         """Test form validation fails with duplicate name on same day"""
         # Create existing category
-        TargetCategory.objects.create(
-            day=self.current_day,
-            name='Health'
-        )
+        with suspend_score_signals():
+            TargetCategory.objects.create(
+                day=self.current_day,
+                name='Health'
+            )
         
         form_data = {
             'name': 'Health',
@@ -59,8 +66,39 @@ class TargetCategoryFormTests(TestCase):
         }
         form = TargetCategoryForm(data=form_data, current_day=self.current_day)
         
-        self.assertFalse(form.is_valid())
+        # Uniqueness is enforced by the database constraint when saving
+        self.assertTrue(form.is_valid())
+        form.instance.day = self.current_day
+        with self.assertRaises(ValidationError):
+            form.save()
         self.assertIn('name', form.errors)
+        self.assertEqual(TargetCategory.objects.filter(day=self.current_day).count(), 1)
+    
+    def test_form_with_case_insensitive_duplicate_name_same_day(self):
+        """Test form save fails when the name differs from an existing one only by case"""
+        TargetCategory.objects.create(
+            day=self.current_day,
+            name='Health'
+        )
+        
+        form = TargetCategoryForm(data={'name': 'health'}, current_day=self.current_day)
+        
+        self.assertTrue(form.is_valid())
+        form.instance.day = self.current_day
+        with self.assertRaises(ValidationError):
+            form.save()
+        self.assertIn('name', form.errors)
+    
+    def test_form_save_reraises_other_integrity_errors(self):
+        """Test that save only reports duplicate names as form errors"""
+        form = TargetCategoryForm(data={'name': 'Health'}, current_day=self.current_day)
+        
+        self.assertTrue(form.is_valid())
+        form.instance.day = self.current_day
+        form.instance.score = -1
+        with self.assertRaises(IntegrityError):
+            form.save()
+        self.assertNotIn('name', form.errors)
     
     def test_form_with_same_name_different_day(self):
         """Test form allows same name on different day"""
@@ -90,7 +128,9 @@ class TargetCategoryFormTests(TestCase):
         self.assertTrue(form.is_valid())
         category = form.save(commit=False)
         category.day = self.current_day
-        category.save()
+        # Inserts, then one grouped rescore of the day
+        with self.assertNumQueries(9):
+            category.save()
         
         self.assertEqual(category.name, 'Health')
         self.assertEqual(category.description, 'Health related targets')
@@ -100,14 +140,16 @@ class TargetCategoryFormTests(TestCase):
 class TargetFormTests(TestCase):
     """Test TargetForm validation and functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.current_day = ScoreDay.objects.create(day=date.today())
-        self.category = TargetCategory.objects.create(
-            day=self.current_day,
-            name='Health'
-        )
-        self.importance = Importance.objects.create(label="High", score=5)
+        cls.current_day = ScoreDay.objects.create(day=date.today())
+        with suspend_score_signals():
+            cls.category = TargetCategory.objects.create(
+                day=cls.current_day,
+                name='Health'
+            )
+        cls.importance = Importance.objects.create(label="High", score=5)
     
     def test_valid_form_data(self):
         """Test form with valid data"""
@@ -160,34 +202,51 @@ class TargetFormTests(TestCase):
         """Test form only shows categories from current day"""
         # Create category on different day
         other_day = ScoreDay.objects.create(day=date.today() + timedelta(days=1))
-        other_category = TargetCategory.objects.create(
-            day=other_day,
-            name='Work'
-        )
+        with suspend_score_signals():
+            other_category = TargetCategory.objects.create(
+                day=other_day,
+                name='Work'
+            )
         
         form = TargetForm(current_day=self.current_day)
         
         # Should only include current day's categories
-        category_choices = [choice[0] for choice in form.fields['category'].choices if choice[0]]
+        category_choices = list(form.fields['category'].queryset.values_list('id', flat=True))
         self.assertIn(self.category.id, category_choices)
         self.assertNotIn(other_category.id, category_choices)
     
     def test_form_excludes_deleted_categories(self):
         """Test form excludes soft-deleted categories"""
         # Create deleted category
-        deleted_category = TargetCategory.objects.create(
-            day=self.current_day,
-            name='Deleted',
-            is_deleted=True
-        )
+        with suspend_score_signals():
+            deleted_category = TargetCategory.objects.create(
+                day=self.current_day,
+                name='Deleted',
+                is_deleted=True
+            )
         
         form = TargetForm(current_day=self.current_day)
         
         # Should not include deleted categories
-        category_choices = [choice[0] for choice in form.fields['category'].choices if choice[0]]
+        category_choices = list(form.fields['category'].queryset.values_list('id', flat=True))
         self.assertIn(self.category.id, category_choices)
         self.assertNotIn(deleted_category.id, category_choices)
     
+    def test_form_renders_prefetched_choices_without_queries(self):
+        """Test form renders category and importance options from prefetched lists"""
+        form = TargetForm(
+            current_day=self.current_day,
+            categories=[self.category],
+            importance_levels=[self.importance]
+        )
+        
+        with self.assertNumQueries(0):
+            category_html = str(form['category'])
+            importance_html = str(form['importance'])
+        
+        self.assertIn('Health', category_html)
+        self.assertIn('High', importance_html)
+    
     def test_form_save_creates_target(self):
         """Test form save creates target correctly"""
         form_data = {
@@ -198,7 +257,9 @@ class TargetFormTests(TestCase):
         form = TargetForm(data=form_data, current_day=self.current_day)
         
         self.assertTrue(form.is_valid())
-        target = form.save()
+        # Inserts, then the max scores shift without a recalculation
+        with self.assertNumQueries(9):
+            target = form.save()
         
         self.assertEqual(target.name, 'Exercise')
         self.assertEqual(target.category, self.category)
@@ -221,6 +282,37 @@ class ImportanceFormTests(TestCase):
         self.assertEqual(form.cleaned_data['label'], 'Critical')
         self.assertEqual(form.cleaned_data['score'], 5)
     
+    def test_form_validation_skips_score_constraint_query(self):
+        """Test that the positive score check is not repeated as a query"""
+        form = ImportanceForm(data={'label': 'Critical', 'score': 5})
+        
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(form.is_valid())
+        
+        self.assertFalse([query for query in queries if '_check' in query['sql']])
+    
+    def test_form_leaves_label_and_score_out_of_model_constraints(self):
+        """
+        Test that the _get_validation_exclusions override still takes effect.
+        It is a private ModelForm hook, so this fails if Django stops calling it.
+        """
+        form = ImportanceForm(data={'label': 'Critical', 'score': 5})
+        
+        with patch.object(Importance, 'validate_constraints', autospec=True) as validate_constraints:
+            self.assertTrue(form.is_valid())
+        
+        validate_constraints.assert_called_once()
+        self.assertLessEqual({'label', 'score'}, validate_constraints.call_args.kwargs['exclude'])
+    
+    def test_form_validation_uses_cached_levels_without_queries(self):
+        """Test that a new label is checked against the cached levels alone"""
+        existing = (Importance.objects.create(label='Critical', score=5),)
+        form = ImportanceForm(data={'label': 'Minor', 'score': 1})
+        
+        with patch('apps.better.forms.get_importances', return_value=existing):
+            with self.assertNumQueries(0):
+                self.assertTrue(form.is_valid())
+    
     def test_form_without_label(self):
         """Test form validation fails without label"""
         form_data = {
@@ -277,6 +369,49 @@ class ImportanceFormTests(TestCase):
         self.assertFalse(form.is_valid())
         self.assertIn('label', form.errors)
     
+    def test_form_with_duplicate_label_in_other_case(self):
+        """Test form validation fails with a label differing only in case"""
+        Importance.objects.create(label='Critical', score=5)
+        
+        form_data = {
+            'label': 'critical',
+            'score': 3
+        }
+        form = ImportanceForm(data=form_data)
+        
+        self.assertFalse(form.is_valid())
+        self.assertIn('label', form.errors)
+    
+    def test_form_update_with_unchanged_label(self):
+        """Test form allows updating the score while keeping the label"""
+        importance = Importance.objects.create(label='Critical', score=5)
+        
+        form = ImportanceForm(data={'label': 'Critical', 'score': 8}, instance=importance)
+        
+        with self.assertNumQueries(0):
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.save().score, 8)
+    
+    def test_form_save_reports_label_taken_after_validation(self):
+        """Test that a label claimed between validation and save is a form error"""
+        form = ImportanceForm(data={'label': 'Critical', 'score': 5})
+        
+        self.assertTrue(form.is_valid())
+        Importance.objects.create(label='critical', score=3)
+        with self.assertRaises(ValidationError):
+            form.save()
+        self.assertIn('label', form.errors)
+    
+    def test_form_save_reraises_other_integrity_errors(self):
+        """Test that save only reports duplicate labels as form errors"""
+        form = ImportanceForm(data={'label': 'Critical', 'score': 5})
+        
+        self.assertTrue(form.is_valid())
+        form.instance.score = 0
+        with self.assertRaises(IntegrityError):
+            form.save()
+        self.assertNotIn('label', form.errors)
+    
     def test_form_save_creates_importance(self):
         """Test form save creates importance correctly"""
         form_data = {
@@ -286,7 +421,8 @@ class ImportanceFormTests(TestCase):
         form = ImportanceForm(data=form_data)
         
         self.assertTrue(form.is_valid())
-        importance = form.save()
+        with self.assertNumQueries(6):
+            importance = form.save()
         
         self.assertEqual(importance.label, 'Critical')
         self.assertEqual(importance.score, 5)
@@ -295,9 +431,10 @@ class ImportanceFormTests(TestCase):
 class SleepWakeTimeFormTests(TestCase):
     """Test SleepWakeTimeForm validation and functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.score_day = ScoreDay.objects.create(day=date.today())
+        cls.score_day = ScoreDay.objects.create(day=date.today())
     
     def test_valid_form_data(self):
         """Test form with valid wake and sleep times"""
@@ -350,7 +487,8 @@ class SleepWakeTimeFormTests(TestCase):
         form = SleepWakeTimeForm(data=form_data, instance=self.score_day)
         
         self.assertTrue(form.is_valid())
-        updated_score_day = form.save()
+        with self.assertNumQueries(2):
+            updated_score_day = form.save()
         
         # Check that times were set (timezone-aware)
         self.assertIsNotNone(updated_score_day.wake_time)
@@ -371,20 +509,22 @@ class SleepWakeTimeFormTests(TestCase):
 class TargetAchievementFormTests(TestCase):
     """Test TargetAchievementForm validation and functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.importance = Importance.objects.create(label="High", score=5)
-        self.current_day = ScoreDay.objects.create(day=date.today())
-        self.category = TargetCategory.objects.create(
-            day=self.current_day,
-            name='Health'
-        )
-        self.target = Target.objects.create(
-            name='Exercise',
-            category=self.category,
-            importance=self.importance,
-            is_achieved=False
-        )
+        cls.importance = Importance.objects.create(label="High", score=5)
+        cls.current_day = ScoreDay.objects.create(day=date.today())
+        with suspend_score_signals():
+            cls.category = TargetCategory.objects.create(
+                day=cls.current_day,
+                name='Health'
+            )
+            cls.target = Target.objects.create(
+                name='Exercise',
+                category=cls.category,
+                importance=cls.importance,
+                is_achieved=False
+            )
     
     def test_form_initialization_with_target(self):
         """Test form initializes correctly with target instance"""
@@ -403,6 +543,20 @@ class TargetAchievementFormTests(TestCase):
         self.assertTrue(form.is_valid())
         self.assertEqual(form.cleaned_data['target_id'], self.target.id)
     
+    def test_form_with_target_validates_without_queries(self):
+        """Test form validates against the provided target instead of querying"""
+        form = TargetAchievementForm(data={'target_id': self.target.id}, target=self.target)
+        
+        with self.assertNumQueries(0):
+            self.assertTrue(form.is_valid())
+    
+    def test_form_with_mismatched_target_id(self):
+        """Test form rejects an ID that does not match the provided target"""
+        form = TargetAchievementForm(data={'target_id': self.target.id + 1}, target=self.target)
+        
+        self.assertFalse(form.is_valid())
+        self.assertIn('target_id', form.errors)
+    
     def test_form_toggle_achievement_to_false(self):
         """Test form can validate invalid target ID"""
         form_data = {
@@ -1,11 +1,16 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from unittest.mock import patch
 
-from django.core.exceptions import ValidationError
-from django.db import IntegrityError
-from django.test import TestCase
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
 from apps.better.models import Target, Importance, ScoreDay, TargetCategory
+from apps.better.signals import suspend_score_signals
+
+# Read once, so every test in a run agrees on the date even across midnight
+TODAY = date.today()
 
 
 class ImportanceModelTests(TestCase):
@@ -30,52 +35,74 @@ class ImportanceModelTests(TestCase):
 
     def test_importance_score_positive_validation(self):
         """Test that importance score must be positive"""
-        importance = Importance(label="Invalid", score=0)
-
-        with self.assertRaises(ValidationError):
-            importance.full_clean()
+        with self.assertRaises(IntegrityError):
+            Importance.objects.create(label="Invalid", score=0)
 
     def test_importance_score_negative_validation(self):
         """Test that importance score cannot be negative"""
-        importance = Importance(label="Invalid", score=-1)
-
-        with self.assertRaises(ValidationError):
-            importance.full_clean()
+        with self.assertRaises(IntegrityError):
+            Importance.objects.create(label="Invalid", score=-1)
 
     def test_get_max_score_with_importances(self):
         """Test get_max_score returns highest importance score"""
-        Importance.objects.create(label="Low", score=1)
-        Importance.objects.create(label="High", score=5)
-        Importance.objects.create(label="Medium", score=3)
-
-        max_score = Importance.get_max_score()
+        Importance.objects.bulk_create([
+            Importance(label="Low", score=1),
+            Importance(label="High", score=5),
+            Importance(label="Medium", score=3),
+        ])
+
+        with self.assertNumQueries(1):
+            max_score = Importance.get_max_score()
         self.assertEqual(max_score, 5)
 
     def test_get_max_score_with_no_importances(self):
         """Test get_max_score returns 0 when no importances exist"""
-        max_score = Importance.get_max_score()
+        with self.assertNumQueries(1):
+            max_score = Importance.get_max_score()
         self.assertEqual(max_score, 0)
 
+    def test_get_management_context_uses_a_single_query(self):
+        """Test that the has-levels flag comes from the fetched levels"""
+        high = Importance.objects.create(label="High", score=5)
+        low = Importance.objects.create(label="Low", score=1)
+
+        with self.assertNumQueries(1):
+            context = Importance.get_management_context()
+
+        self.assertEqual(context['importance_levels'], [high, low])
+        self.assertTrue(context['has_importance_levels'])
+
+    def test_management_action_reports_unknown_importance(self):
+        """Test that update and delete report a missing or malformed id as not found"""
+        for action in ('update', 'delete'):
+            for importance_id in ('999', 'abc'):
+                with self.subTest(action=action, importance_id=importance_id):
+                    result = Importance.handle_management_action(action, {'importance_id': importance_id})
+                    self.assertEqual(result, ('error', 'Importance level not found.', None))
+
     def test_importance_ordering(self):
         """Test that importances are ordered by score descending"""
-        low = Importance.objects.create(label="Low", score=1)
-        high = Importance.objects.create(label="High", score=5)
-        medium = Importance.objects.create(label="Medium", score=3)
+        Importance.objects.bulk_create([
+            Importance(label="Low", score=1),
+            Importance(label="High", score=5),
+            Importance(label="Medium", score=3),
+        ])
 
-        importances = list(Importance.objects.all())
-        self.assertEqual(importances, [high, medium, low])
+        labels = list(Importance.objects.values_list('label', flat=True))
+        self.assertEqual(labels, ["High", "Medium", "Low"])
 
 
 class ScoreDayModelTests(TestCase):
     """Test class for ScoreDay model testing score calculations"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.importance_high = Importance.objects.create(label="High", score=5)
-        self.importance_low = Importance.objects.create(label="Low", score=2)
+        cls.importance_high = Importance.objects.create(label="High", score=5)
+        cls.importance_low = Importance.objects.create(label="Low", score=2)
 
-        self.today = date.today()
-        self.yesterday = self.today - timedelta(days=1)
+        cls.today = TODAY
+        cls.yesterday = cls.today - timedelta(days=1)
 
     def test_scoreday_creation(self):
         """Test creating a ScoreDay with valid data"""
@@ -112,19 +139,20 @@ class ScoreDayModelTests(TestCase):
             name="Health"
         )
 
-        Target.objects.create(
-            name="Exercise",
-            category=category,
-            importance=self.importance_high,
-            is_achieved=True
-        )
+        with suspend_score_signals():
+            Target.objects.create(
+                name="Exercise",
+                category=category,
+                importance=self.importance_high,
+                is_achieved=True
+            )
 
-        Target.objects.create(
-            name="Meditate",
-            category=category,
-            importance=self.importance_low,
-            is_achieved=False
-        )
+            Target.objects.create(
+                name="Meditate",
+                category=category,
+                importance=self.importance_low,
+                is_achieved=False
+            )
 
         score_day.calculate_scores()
 
@@ -137,50 +165,91 @@ class ScoreDayModelTests(TestCase):
         """Test score calculation with multiple categories"""
         score_day = ScoreDay.objects.create(day=self.today)
 
-        # Category 1
-        category1 = TargetCategory.objects.create(day=score_day, name="Health")
+        with suspend_score_signals():
+            # Category 1
+            category1 = TargetCategory.objects.create(day=score_day, name="Health")
+            Target.objects.create(
+                name="Exercise",
+                category=category1,
+                importance=self.importance_high,
+                is_achieved=True
+            )
+
+            # Category 2
+            category2 = TargetCategory.objects.create(day=score_day, name="Work")
+            Target.objects.create(
+                name="Complete task",
+                category=category2,
+                importance=self.importance_low,
+                is_achieved=True
+            )
+
+        # Importance levels, category scores, their bulk update and the day save,
+        # however many categories the day has
+        with self.assertNumQueries(7):
+            score_day.calculate_scores()
+
+        # Expected: max_score = (1*5) + (1*5) = 10
+        # Expected: score = 5 + 2 = 7
+        self.assertEqual(score_day.max_score, 10)
+        self.assertEqual(score_day.score, 7)
+
+    def test_calculate_scores_looks_up_max_importance_once(self):
+        """Test that the highest importance score is fetched once per day"""
+        score_day = ScoreDay.objects.create(day=self.today)
+        for name in ["Health", "Work", "Family"]:
+            category = TargetCategory.objects.create(day=score_day, name=name)
+            Target.objects.create(
+                name=f"{name} target",
+                category=category,
+                importance=self.importance_low,
+                is_achieved=True
+            )
+
+        with patch.object(Importance, 'get_max_score', return_value=5) as get_max_score:
+            score_day.calculate_scores()
+
+        get_max_score.assert_called_once()
+        self.assertEqual(score_day.max_score, 15)
+        self.assertEqual(score_day.score, 6)
+
+    def test_calculate_scores_saves_category_scores_in_constant_queries(self):
+        """Test that category scores are stored without a query per category"""
+        score_day = ScoreDay.objects.create(day=self.today)
+        health = TargetCategory.objects.create(day=score_day, name="Health")
         Target.objects.create(
             name="Exercise",
-            category=category1,
+            category=health,
             importance=self.importance_high,
             is_achieved=True
         )
-
-        # Category 2
-        category2 = TargetCategory.objects.create(day=score_day, name="Work")
         Target.objects.create(
-            name="Complete task",
-            category=category2,
+            name="Meditate",
+            category=health,
             importance=self.importance_low,
-            is_achieved=True
+            is_achieved=False
         )
 
-        score_day.calculate_scores()
+        with CaptureQueriesContext(connection) as one_category:
+            score_day.calculate_scores()
 
-        # Expected: max_score = (1*5) + (1*5) = 10
-        # Expected: score = 5 + 2 = 7
-        self.assertEqual(score_day.max_score, 10)
-        self.assertEqual(score_day.score, 7)
+        for name in ["Work", "Family"]:
+            category = TargetCategory.objects.create(day=score_day, name=name)
+            Target.objects.create(
+                name=f"{name} target",
+                category=category,
+                importance=self.importance_low,
+                is_achieved=True
+            )
 
-    def test_get_normalized_score_with_zero_max_score(self):
-        """Test normalized score returns 0 when max_score is 0"""
-        score_day = ScoreDay.objects.create(day=self.today, score=0, max_score=0)
-        normalized = score_day.get_normalized_score()
-        self.assertEqual(normalized, 0)
+        with self.assertNumQueries(len(one_category)):
+            score_day.calculate_scores()
 
-    def test_get_normalized_score_with_small_max_score(self):
-        """Test normalized score with factor 10 for small max scores"""
-        score_day = ScoreDay.objects.create(day=self.today, score=3, max_score=10)
-        normalized = score_day.get_normalized_score()
-        # 30% * 10 / 100 = 3.0
-        self.assertEqual(normalized, 3.0)
-
-    def test_get_normalized_score_with_large_max_score(self):
-        """Test normalized score with factor 100 for large max scores"""
-        score_day = ScoreDay.objects.create(day=self.today, score=75, max_score=150)
-        normalized = score_day.get_normalized_score()
-        # 50% * 100 / 100 = 50.0
-        self.assertEqual(normalized, 50.0)
+        health.refresh_from_db()
+        self.assertEqual(health.max_score, 10)
+        self.assertEqual(health.score, 5)
+        self.assertEqual(score_day.max_score, 20)
+        self.assertEqual(score_day.score, 9)
 
     def test_copy_previous_day_categories_with_no_previous_day(self):
         """Test copying categories when no previous day exists"""
@@ -207,7 +276,10 @@ class ScoreDayModelTests(TestCase):
 
         # Create current day and copy
         current_day = ScoreDay.objects.create(day=self.today)
-        current_day.copy_previous_day_categories()
+        # Lookups and prefetch, two inserts per copied row, then one rescore of
+        # the new day and its category
+        with self.assertNumQueries(16):
+            current_day.copy_previous_day_categories()
 
         # Verify category was copied
         self.assertEqual(current_day.categories.count(), 1)
@@ -224,10 +296,58 @@ class ScoreDayModelTests(TestCase):
         self.assertEqual(new_target.importance, self.importance_high)
         self.assertFalse(new_target.is_achieved)  # Should be reset
 
+    def test_copy_previous_day_categories_rescores_day_once(self):
+        """Test that copying many targets rescores the new day a single time"""
+        prev_day = ScoreDay.objects.create(day=self.yesterday)
+        for category_name in ["Health", "Work"]:
+            prev_category = TargetCategory.objects.create(day=prev_day, name=category_name)
+            for target_name in ["One", "Two", "Three"]:
+                Target.objects.create(
+                    name=target_name,
+                    category=prev_category,
+                    importance=self.importance_low
+                )
+        Target.objects.create(
+            name="Deleted",
+            category=prev_category,
+            importance=self.importance_low,
+            is_deleted=True
+        )
+
+        current_day = ScoreDay.objects.create(day=self.today)
+        with patch.object(ScoreDay, 'calculate_scores', autospec=True,
+                          side_effect=ScoreDay.calculate_scores) as day_calc:
+            current_day.copy_previous_day_categories()
+
+        day_calc.assert_called_once()
+        self.assertEqual(Target.objects.filter(category__day=current_day).count(), 6)
+        current_day.refresh_from_db()
+        self.assertEqual(current_day.max_score, 30)
+
+    def test_copy_previous_day_categories_only_adds_inserts_per_target(self):
+        """Test that each extra copied target costs its inserts and no further queries"""
+        copies = {}
+        for target_count, offset in ((1, 3), (3, 1)):
+            prev_day = ScoreDay.objects.create(day=self.today - timedelta(days=offset + 1))
+            with suspend_score_signals():
+                prev_category = TargetCategory.objects.create(day=prev_day, name="Health")
+                for index in range(target_count):
+                    Target.objects.create(
+                        name=f"Target {index}",
+                        category=prev_category,
+                        importance=self.importance_low
+                    )
+
+            current_day = ScoreDay.objects.create(day=self.today - timedelta(days=offset))
+            with CaptureQueriesContext(connection) as copies[target_count]:
+                current_day.copy_previous_day_categories()
+
+        # Target inherits from BaseModel, so each copy is one insert per table
+        self.assertEqual(len(copies[3]) - len(copies[1]), 2 * 2)
+
     @patch('django.utils.timezone.now')
     def test_get_or_create_today_creates_new_day(self, mock_now):
         """Test get_or_create_today creates new ScoreDay for today"""
-        from datetime import datetime
         mock_datetime = datetime.combine(self.today, datetime.min.time())
         mock_now.return_value = mock_datetime
 
@@ -239,7 +359,6 @@ class ScoreDayModelTests(TestCase):
     @patch('django.utils.timezone.now')
     def test_get_or_create_today_returns_existing_day(self, mock_now):
         """Test get_or_create_today returns existing ScoreDay"""
-        from datetime import datetime
         mock_datetime = datetime.combine(self.today, datetime.min.time())
         mock_now.return_value = mock_datetime
 
@@ -249,16 +368,248 @@ class ScoreDayModelTests(TestCase):
         self.assertEqual(score_day.id, existing_day.id)
         self.assertEqual(ScoreDay.objects.count(), 1)
 
+    @patch('django.utils.timezone.now')
+    def test_get_or_create_today_existing_day_single_query(self, mock_now):
+        """Test that an existing day is returned with one lookup"""
+        mock_now.return_value = datetime.combine(self.today, datetime.min.time())
+
+        existing_day = ScoreDay.objects.create(day=self.today)
+        with self.assertNumQueries(1):
+            score_day = ScoreDay.get_or_create_today()
+
+        self.assertEqual(score_day.id, existing_day.id)
+
+    def test_get_dashboard_context_counts_targets_in_memory(self):
+        """Test that dashboard target counts don't cost queries per category"""
+        score_day = ScoreDay.objects.create(day=self.today)
+        health = TargetCategory.objects.create(day=score_day, name="Health")
+        Target.objects.create(name="Exercise", category=health, importance=self.importance_high, is_achieved=True)
+        Target.objects.create(name="Meditate", category=health, importance=self.importance_low)
+        Target.objects.create(name="Deleted", category=health, importance=self.importance_low, is_deleted=True)
+
+        with CaptureQueriesContext(connection) as one_category:
+            context = score_day.get_dashboard_context()
+
+        health_data = context['categories_data'][0]
+        self.assertEqual(health_data['achieved_count'], 1)
+        self.assertEqual(health_data['total_count'], 2)
+        self.assertEqual([target.name for target in health_data['targets']], ["Exercise", "Meditate"])
+        self.assertIn('updated_at', health_data['targets'][0].get_deferred_fields())
+
+        work = TargetCategory.objects.create(day=score_day, name="Work")
+        Target.objects.create(name="Report", category=work, importance=self.importance_low)
+
+        score_day = ScoreDay.objects.get(pk=score_day.pk)
+        with CaptureQueriesContext(connection) as two_categories:
+            score_day.get_dashboard_context()
+
+        self.assertEqual(len(two_categories), len(one_category))
+
+    def test_get_dashboard_context_matches_yesterday_categories_by_name(self):
+        """Test that yesterday's categories are fetched once and matched by name"""
+        yesterday_day = ScoreDay.objects.create(day=self.today - timedelta(days=1))
+        yesterday_health = TargetCategory.objects.create(day=yesterday_day, name="Health")
+        Target.objects.create(name="Run", category=yesterday_health, importance=self.importance_low, is_achieved=True)
+        Target.objects.create(name="Stretch", category=yesterday_health, importance=self.importance_low)
+        Target.objects.create(name="Deleted", category=yesterday_health, importance=self.importance_low, is_deleted=True)
+        TargetCategory.objects.create(day=yesterday_day, name="Work")
+        # Set scores directly, the save signals would recalculate them from targets
+        TargetCategory.objects.filter(day=yesterday_day).update(score=2, max_score=4)
+
+        score_day = ScoreDay.objects.create(day=self.today)
+        health = TargetCategory.objects.create(day=score_day, name="Health")
+        Target.objects.create(name="Exercise", category=health, importance=self.importance_high, is_achieved=True)
+        reading = TargetCategory.objects.create(day=score_day, name="Reading")
+        Target.objects.create(name="Book", category=reading, importance=self.importance_low)
+
+        score_day = ScoreDay.objects.get(pk=score_day.pk)
+        with CaptureQueriesContext(connection) as two_categories:
+            context = score_day.get_dashboard_context()
+
+        changes = {data['category'].name: data['category'].yesterday_change for data in context['categories_data']}
+        self.assertEqual(changes, {"Health": 50.0, "Reading": None})
+        self.assertEqual(
+            [(data['category'].name, data['achieved_count'], data['total_count'])
+             for data in context['yesterday_categories']],
+            [("Health", 1, 2), ("Work", 0, 0)]
+        )
+
+        work = TargetCategory.objects.create(day=score_day, name="Work")
+        Target.objects.create(name="Report", category=work, importance=self.importance_low)
+
+        score_day = ScoreDay.objects.get(pk=score_day.pk)
+        with CaptureQueriesContext(connection) as three_categories:
+            score_day.get_dashboard_context()
+
+        # Today's categories no longer look up yesterday's counterpart one by one
+        self.assertEqual(len(three_categories), len(two_categories))
+
+    def test_recalculate_scores_for_ids_uses_constant_queries_for_many_days(self):
+        """Test that rescoring several days costs the same queries as one"""
+        days = []
+        for offset in range(3):
+            score_day = ScoreDay.objects.create(day=self.today - timedelta(days=offset))
+            category = TargetCategory.objects.create(day=score_day, name="Health")
+            Target.objects.create(name="Exercise", category=category, importance=self.importance_high, is_achieved=True)
+            Target.objects.create(name="Meditate", category=category, importance=self.importance_low)
+            days.append(score_day)
+        ScoreDay.objects.update(score=0, max_score=0)
+        TargetCategory.objects.update(score=0, max_score=0)
+
+        with CaptureQueriesContext(connection) as one_day:
+            ScoreDay.recalculate_scores_for_ids([days[0].pk])
+        with CaptureQueriesContext(connection) as three_days:
+            ScoreDay.recalculate_scores_for_ids([day.pk for day in days])
+
+        self.assertEqual(len(three_days), len(one_day))
+        for score_day in ScoreDay.objects.all():
+            self.assertEqual((score_day.score, score_day.max_score), (5, 10))
+        for category in TargetCategory.objects.all():
+            self.assertEqual((category.score, category.max_score), (5, 10))
+
+    def test_recalculate_scores_for_ids_loads_days_per_batch(self):
+        """Test that days are loaded by id slices and scored batch by batch"""
+        days = []
+        for offset in range(3):
+            score_day = ScoreDay.objects.create(day=self.today - timedelta(days=offset))
+            with suspend_score_signals():
+                category = TargetCategory.objects.create(day=score_day, name="Health")
+                Target.objects.create(name="Run", category=category, importance=self.importance_high)
+            days.append(score_day)
+
+        with patch.object(ScoreDay, '_recalculate_batch', side_effect=ScoreDay._recalculate_batch) as batch:
+            ScoreDay.recalculate_scores_for_ids([day.pk for day in days], batch_size=2)
+
+        batches = [{day.pk for day in call.args[0]} for call in batch.call_args_list]
+        self.assertEqual(batches, [{days[0].pk, days[1].pk}, {days[2].pk}])
+        for score_day in ScoreDay.objects.all():
+            self.assertEqual((score_day.score, score_day.max_score), (0, 5))
+
+    def test_get_score_color_class_boundaries(self):
+        """Test that each color band starts at its threshold"""
+        expected = [
+            (None, 0, "text-zinc-500"),
+            (0, 100, "text-red-500"),
+            (19, 100, "text-red-500"),
+            (None, 100, "text-red-500"),
+            (1, 5, "text-red-400"),
+            (3, 4, "text-green-500"),
+            (179, 200, "text-green-500"),
+            (20, 100, "text-red-400"),
+            (40, 100, "text-orange-400"),
+            (60, 100, "text-yellow-400"),
+            (74, 100, "text-yellow-400"),
+            (75, 100, "text-green-500"),
+            (90, 100, "text-green-400"),
+            (100, 100, "text-green-400"),
+        ]
+        for score, max_score, color_class in expected:
+            with self.subTest(score=score, max_score=max_score):
+                score_day = ScoreDay(day=self.today, score=score, max_score=max_score)
+                self.assertEqual(score_day.get_score_color_class(), color_class)
+
+    def test_previous_and_next_day_share_one_query(self):
+        """Test that adjacent days are fetched together and reused"""
+        today = timezone.now().date()
+        previous_day = ScoreDay.objects.create(day=today - timedelta(days=2))
+        score_day = ScoreDay.objects.create(day=today - timedelta(days=1))
+        next_day = ScoreDay.objects.create(day=today)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(score_day.get_previous_day(), previous_day)
+            self.assertEqual(score_day.get_next_day(), next_day)
+            self.assertEqual(score_day.get_previous_day(), previous_day)
+
+        # Tomorrow is in the future, so today has no next day
+        self.assertEqual(next_day.get_previous_day(), score_day)
+        self.assertIsNone(next_day.get_next_day())
+
+    def test_get_yesterday_change(self):
+        """Test percentage change against yesterday's score"""
+        ScoreDay.objects.create(day=self.yesterday, score=5, max_score=10)
+        score_day = ScoreDay.objects.create(day=self.today, score=8, max_score=10)
+
+        self.assertEqual(score_day.get_yesterday_change(), 30)
+
+    def test_with_yesterday_change_annotates_days_in_one_query(self):
+        """Test that annotated days report their change without extra queries"""
+        ScoreDay.objects.create(day=self.today - timedelta(days=3), score=2, max_score=10)
+        ScoreDay.objects.create(day=self.yesterday, score=5, max_score=10)
+        ScoreDay.objects.create(day=self.today, score=8, max_score=10)
+
+        with self.assertNumQueries(1):
+            changes = {
+                score_day.day: score_day.get_yesterday_change()
+                for score_day in ScoreDay.with_yesterday_change()
+            }
+
+        self.assertEqual(changes[self.today], 30)
+        # The day before yesterday is missing, so yesterday has nothing to compare to
+        self.assertIsNone(changes[self.yesterday])
+        self.assertIsNone(changes[self.today - timedelta(days=3)])
 
 class TargetCategoryModelTests(TestCase):
     """Test class for TargetCategory model testing category scoring"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.importance_high = Importance.objects.create(label="High", score=5)
-        self.importance_low = Importance.objects.create(label="Low", score=2)
+        cls.importance_high = Importance.objects.create(label="High", score=5)
+        cls.importance_low = Importance.objects.create(label="Low", score=2)
+
+        cls.score_day = ScoreDay.objects.create(day=TODAY)
+
+    def test_soft_delete_with_targets_takes_category_off_day(self):
+        """Test that soft deleting a category removes it and its targets from the day total"""
+        health = TargetCategory.objects.create(day=self.score_day, name="Health")
+        Target.objects.create(name="Exercise", category=health, importance=self.importance_high, is_achieved=True)
+        work = TargetCategory.objects.create(day=self.score_day, name="Work")
+        Target.objects.create(name="Report", category=work, importance=self.importance_low, is_achieved=True)
+
+        health.refresh_from_db()
+        with patch.object(ScoreDay, 'calculate_scores') as day_calc:
+            health.soft_delete_with_targets()
+        day_calc.assert_not_called()
+
+        self.score_day.refresh_from_db()
+        self.assertEqual(self.score_day.score, 2)
+        self.assertEqual(self.score_day.max_score, 5)
+        self.assertFalse(Target.objects.filter(category=health, is_deleted=False).exists())
+
+        # The day total matches a full recalculation
+        self.score_day.calculate_scores()
+        self.assertEqual((self.score_day.score, self.score_day.max_score), (2, 5))
+
+        # Deleting again doesn't take the scores off twice
+        health.soft_delete_with_targets()
+        self.score_day.refresh_from_db()
+        self.assertEqual(self.score_day.score, 2)
 
-        self.score_day = ScoreDay.objects.create(day=date.today())
+    def test_soft_delete_with_targets_uses_stored_scores(self):
+        """Test that a stale instance's scores don't reach the day total"""
+        health = TargetCategory.objects.create(day=self.score_day, name="Health")
+        Target.objects.create(name="Exercise", category=health, importance=self.importance_high, is_achieved=True)
+        work = TargetCategory.objects.create(day=self.score_day, name="Work")
+        Target.objects.create(name="Report", category=work, importance=self.importance_low, is_achieved=True)
+
+        health.score, health.max_score = 0, 0
+        health.soft_delete_with_targets()
+
+        self.score_day.refresh_from_db()
+        self.assertEqual((self.score_day.score, self.score_day.max_score), (2, 5))
+
+    def test_soft_delete_with_targets_rescores_drifted_day(self):
+        """Test that a day total below the category's scores is rescored, not clamped"""
+        health = TargetCategory.objects.create(day=self.score_day, name="Health")
+        Target.objects.create(name="Exercise", category=health, importance=self.importance_high, is_achieved=True)
+        work = TargetCategory.objects.create(day=self.score_day, name="Work")
+        Target.objects.create(name="Report", category=work, importance=self.importance_low, is_achieved=True)
+        ScoreDay.objects.filter(pk=self.score_day.pk).update(score=1, max_score=1)
+
+        health.soft_delete_with_targets()
+
+        self.score_day.refresh_from_db()
+        self.assertEqual((self.score_day.score, self.score_day.max_score), (2, 5))
 
     def test_target_category_creation(self):
         """Test creating TargetCategory with valid data"""
@@ -283,7 +634,7 @@ class TargetCategoryModelTests(TestCase):
 
     def test_target_category_same_name_different_days(self):
         """Test that same category name can exist on different days"""
-        other_day = ScoreDay.objects.create(day=date.today() + timedelta(days=1))
+        other_day = ScoreDay.objects.create(day=TODAY + timedelta(days=1))
 
         category1 = TargetCategory.objects.create(day=self.score_day, name="Health")
         category2 = TargetCategory.objects.create(day=other_day, name="Health")
@@ -309,19 +660,20 @@ class TargetCategoryModelTests(TestCase):
             name="Health"
         )
 
-        Target.objects.create(
-            name="Exercise",
-            category=category,
-            importance=self.importance_high,
-            is_achieved=False
-        )
+        with suspend_score_signals():
+            Target.objects.create(
+                name="Exercise",
+                category=category,
+                importance=self.importance_high,
+                is_achieved=False
+            )
 
-        Target.objects.create(
-            name="Meditate",
-            category=category,
-            importance=self.importance_low,
-            is_achieved=False
-        )
+            Target.objects.create(
+                name="Meditate",
+                category=category,
+                importance=self.importance_low,
+                is_achieved=False
+            )
 
         category.calculate_scores()
 
@@ -337,19 +689,20 @@ class TargetCategoryModelTests(TestCase):
             name="Health"
         )
 
-        Target.objects.create(
-            name="Exercise",
-            category=category,
-            importance=self.importance_high,
-            is_achieved=True
-        )
+        with suspend_score_signals():
+            Target.objects.create(
+                name="Exercise",
+                category=category,
+                importance=self.importance_high,
+                is_achieved=True
+            )
 
-        Target.objects.create(
-            name="Meditate",
-            category=category,
-            importance=self.importance_low,
-            is_achieved=False
-        )
+            Target.objects.create(
+                name="Meditate",
+                category=category,
+                importance=self.importance_low,
+                is_achieved=False
+            )
 
         category.calculate_scores()
 
@@ -365,19 +718,20 @@ class TargetCategoryModelTests(TestCase):
             name="Health"
         )
 
-        Target.objects.create(
-            name="Exercise",
-            category=category,
-            importance=self.importance_high,
-            is_achieved=True
-        )
+        with suspend_score_signals():
+            Target.objects.create(
+                name="Exercise",
+                category=category,
+                importance=self.importance_high,
+                is_achieved=True
+            )
 
-        Target.objects.create(
-            name="Meditate",
-            category=category,
-            importance=self.importance_low,
-            is_achieved=True
-        )
+            Target.objects.create(
+                name="Meditate",
+                category=category,
+                importance=self.importance_low,
+                is_achieved=True
+            )
 
         category.calculate_scores()
 
@@ -418,56 +772,82 @@ class TargetCategoryModelTests(TestCase):
         self.assertEqual(category.max_score, 5)
         self.assertEqual(category.score, 5)
 
-    def test_get_normalized_score_with_zero_max_score(self):
-        """Test normalized score returns 0 when max_score is 0"""
+    def test_calculate_scores_query_count_independent_of_targets(self):
+        """Test that achieved targets don't add a query each"""
         category = TargetCategory.objects.create(
             day=self.score_day,
-            name="Health",
-            score=0,
-            max_score=0
+            name="Health"
         )
+        Target.objects.create(
+            name="Exercise",
+            category=category,
+            importance=self.importance_high,
+            is_achieved=True
+        )
+
+        with CaptureQueriesContext(connection) as single_target:
+            category.calculate_scores()
+
+        for name in ["Meditate", "Read", "Walk"]:
+            Target.objects.create(
+                name=name,
+                category=category,
+                importance=self.importance_low,
+                is_achieved=True
+            )
+
+        with self.assertNumQueries(len(single_target)):
+            category.calculate_scores()
+
+        self.assertEqual(category.max_score, 20)
+        self.assertEqual(category.score, 11)
 
-        normalized = category.get_normalized_score()
-        self.assertEqual(normalized, 0)
+
+class NormalizedScoreTests(SimpleTestCase):
+    """Test class for normalized scores, computed from unsaved instances"""
+
+    def test_get_normalized_score_with_zero_max_score(self):
+        """Test normalized score returns 0 when max_score is 0"""
+        for instance in (
+            ScoreDay(day=TODAY, score=0, max_score=0),
+            TargetCategory(name="Health", score=0, max_score=0),
+        ):
+            with self.subTest(model=type(instance).__name__):
+                self.assertEqual(instance.get_normalized_score(), 0)
 
     def test_get_normalized_score_with_small_max_score(self):
         """Test normalized score with factor 10 for small max scores"""
-        category = TargetCategory.objects.create(
-            day=self.score_day,
-            name="Health",
-            score=3,
-            max_score=10
-        )
-
-        normalized = category.get_normalized_score()
-        # 30% * 10 / 100 = 3.0
-        self.assertEqual(normalized, 3.0)
+        for instance in (
+            ScoreDay(day=TODAY, score=3, max_score=10),
+            TargetCategory(name="Health", score=3, max_score=10),
+        ):
+            with self.subTest(model=type(instance).__name__):
+                # 30% * 10 / 100 = 3.0
+                self.assertEqual(instance.get_normalized_score(), 3.0)
 
     def test_get_normalized_score_with_large_max_score(self):
         """Test normalized score with factor 100 for large max scores"""
-        category = TargetCategory.objects.create(
-            day=self.score_day,
-            name="Health",
-            score=75,
-            max_score=150
-        )
-
-        normalized = category.get_normalized_score()
-        # 50% * 100 / 100 = 50.0
-        self.assertEqual(normalized, 50.0)
+        for instance in (
+            ScoreDay(day=TODAY, score=75, max_score=150),
+            TargetCategory(name="Health", score=75, max_score=150),
+        ):
+            with self.subTest(model=type(instance).__name__):
+                # 50% * 100 / 100 = 50.0
+                self.assertEqual(instance.get_normalized_score(), 50.0)
 
 
 class TargetModelTests(TestCase):
     """Test class for Target model testing achievement logic"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.importance_high = Importance.objects.create(label="High", score=5)
-        self.importance_low = Importance.objects.create(label="Low", score=2)
+        cls.importance_high = Importance.objects.create(label="High", score=5)
+        cls.importance_low = Importance.objects.create(label="Low", score=2)
 
-        self.score_day = ScoreDay.objects.create(day=date.today())
-        self.category = TargetCategory.objects.create(
-            day=self.score_day,
+        cls.score_day = ScoreDay.objects.create(day=TODAY)
+        cls.category = TargetCategory.objects.create(
+            day=cls.score_day,
             name="Health"
         )
 
@@ -488,7 +868,7 @@ class TargetModelTests(TestCase):
 
     def test_target_default_is_achieved_false(self):
         """Test that targets default to not achieved"""
-        target = Target.objects.create(
+        target = Target(
             name="Exercise",
             category=self.category,
             importance=self.importance_high
@@ -568,25 +948,71 @@ class TargetModelTests(TestCase):
         self.assertGreater(self.score_day.score, initial_score)
         self.assertEqual(self.score_day.score, self.importance_high.score)
 
-    def test_target_ordering(self):
-        """Test that targets are ordered by importance score descending, then name"""
-        target_low = Target.objects.create(
-            name="B Task",
+    def test_toggle_achievement_in_deleted_category_leaves_day_score(self):
+        """Test that a deleted category's targets don't move the day score"""
+        target = Target.objects.create(
+            name="Exercise",
             category=self.category,
-            importance=self.importance_low
+            importance=self.importance_high,
+            is_achieved=False
         )
+        self.category.is_deleted = True
+        self.category.save()
+        self.score_day.refresh_from_db()
+        initial_score = self.score_day.score
 
-        target_high = Target.objects.create(
-            name="A Task",
+        target = Target.objects.get(pk=target.pk)
+        target.toggle_achievement()
+
+        self.score_day.refresh_from_db()
+        self.assertEqual(self.score_day.score, initial_score)
+
+    def test_toggle_achievement_recalculates_drifted_scores(self):
+        """Test that missing or too-small stored scores are recalculated, not shifted"""
+        target = Target.objects.create(
+            name="Exercise",
             category=self.category,
-            importance=self.importance_high
+            importance=self.importance_high,
+            is_achieved=True
         )
-
-        target_high2 = Target.objects.create(
-            name="C Task",
+        Target.objects.create(
+            name="Read",
             category=self.category,
-            importance=self.importance_high
+            importance=self.importance_low,
+            is_achieved=True
         )
+        TargetCategory.objects.filter(pk=self.category.pk).update(score=None)
+        ScoreDay.objects.filter(pk=self.score_day.pk).update(score=0)
+
+        target = Target.objects.get(pk=target.pk)
+        target.toggle_achievement()
+
+        self.category.refresh_from_db()
+        self.score_day.refresh_from_db()
+        self.assertEqual((self.category.score, self.category.max_score), (2, 10))
+        self.assertEqual((self.score_day.score, self.score_day.max_score), (2, 10))
+        self.assertEqual(target.category.score, 2)
+
+    def test_target_ordering(self):
+        """Test that targets are ordered by importance score descending, then name"""
+        with suspend_score_signals():
+            target_low = Target.objects.create(
+                name="B Task",
+                category=self.category,
+                importance=self.importance_low
+            )
+
+            target_high = Target.objects.create(
+                name="A Task",
+                category=self.category,
+                importance=self.importance_high
+            )
+
+            target_high2 = Target.objects.create(
+                name="C Task",
+                category=self.category,
+                importance=self.importance_high
+            )
 
         targets = list(Target.objects.all())
         # Should be ordered by importance desc, then name asc
@@ -1,7 +1,11 @@
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase, override_settings
 from datetime import date, timedelta
+from unittest.mock import patch
 
+from apps.better.cache import get_importances, invalidate_importances
 from apps.better.models import ScoreDay, TargetCategory, Target, Importance
+from apps.better.scoring import coalesce_recalculations
+from apps.better.signals import suspend_score_signals
 
 
 class TargetSignalTests(TestCase):
@@ -38,6 +42,53 @@ class TargetSignalTests(TestCase):
         self.assertEqual(self.score_day.score, self.importance_high.score)
         self.assertEqual(self.score_day.max_score, self.importance_high.score)
     
+    def test_unachieved_target_creation_only_adds_max_score(self):
+        """Test that a new unachieved target shifts the max scores without recalculating"""
+        Target.objects.create(
+            name="Exercise",
+            category=self.category,
+            importance=self.importance_high,
+            is_achieved=True
+        )
+        
+        with patch.object(ScoreDay, 'calculate_scores') as day_calc, \
+                patch.object(TargetCategory, 'calculate_scores') as category_calc:
+            Target.objects.create(
+                name="Meditate",
+                category=self.category,
+                importance=self.importance_low
+            )
+        
+        day_calc.assert_not_called()
+        category_calc.assert_not_called()
+        self.category.refresh_from_db()
+        self.score_day.refresh_from_db()
+        self.assertEqual((self.category.score, self.category.max_score), (5, 10))
+        self.assertEqual((self.score_day.score, self.score_day.max_score), (5, 10))
+    
+    def test_suspend_score_signals_skips_and_then_restores_recalculation(self):
+        """Test that score receivers are off inside the block and back on after it"""
+        with suspend_score_signals():
+            Target.objects.create(
+                name="Exercise",
+                category=self.category,
+                importance=self.importance_high,
+                is_achieved=True
+            )
+        
+        self.category.refresh_from_db()
+        self.assertFalse(self.category.score)
+        
+        Target.objects.create(
+            name="Meditate",
+            category=self.category,
+            importance=self.importance_high,
+            is_achieved=True
+        )
+        
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.score, 10)
+    
     def test_target_update_triggers_recalculation(self):
         """Test that updating a target triggers score recalculation"""
         target = Target.objects.create(
@@ -191,6 +242,102 @@ class ImportanceSignalTests(TestCase):
         # Max score should have changed (now based on medium importance as highest)
         self.assertNotEqual(self.day1.max_score, initial_max_score)
 
+    def test_importance_label_change_skips_recalculation(self):
+        """Test that renaming an importance level does not rescore any day"""
+        self.importance_high.label = "Very high"
+        with patch.object(ScoreDay, 'recalculate_scores_for_ids') as recalculate:
+            self.importance_high.save()
+
+        recalculate.assert_not_called()
+
+    def test_importance_save_without_score_field_skips_lookups(self):
+        """Test that a save limited to the label only runs its UPDATE"""
+        self.importance_high.label = "Very high"
+        with patch.object(ScoreDay, 'recalculate_scores_for_ids') as recalculate, \
+                self.assertNumQueries(1):
+            self.importance_high.save(update_fields=['label'])
+
+        recalculate.assert_not_called()
+
+    def test_importance_score_change_recalculates_only_affected_days(self):
+        """Test that a non-top score change only rescores days using that level"""
+        day3 = ScoreDay.objects.create(day=date.today() + timedelta(days=2))
+        category3 = TargetCategory.objects.create(day=day3, name="Family")
+        Target.objects.create(
+            name="Call parents",
+            category=category3,
+            importance=self.importance_low,
+            is_achieved=True
+        )
+
+        self.importance_low.score = 3
+        with patch.object(ScoreDay, '_recalculate_batch',
+                          side_effect=ScoreDay._recalculate_batch) as recalculate:
+            self.importance_low.save()
+
+        recalculate.assert_called_once()
+        self.assertEqual([day.pk for day in recalculate.call_args.args[0]], [day3.pk])
+        day3.refresh_from_db()
+        self.assertEqual(day3.score, 3)
+        self.assertEqual(day3.max_score, 5)
+
+
+class ImportanceCacheSignalTests(TransactionTestCase):
+    """Test that Importance signals invalidate the process-level importance cache"""
+    
+    def setUp(self):
+        """Start every test with an empty cache"""
+        invalidate_importances()
+        self.addCleanup(invalidate_importances)
+    
+    def test_get_importances_is_cached_outside_transactions(self):
+        """Test that repeated reads are served without queries"""
+        Importance.objects.create(label="High", score=5)
+        get_importances()
+        
+        with self.assertNumQueries(0):
+            importances = get_importances()
+        
+        self.assertEqual([importance.label for importance in importances], ["High"])
+    
+    def test_importance_save_invalidates_cache(self):
+        """Test that saving an importance level refreshes the cached list"""
+        Importance.objects.create(label="Low", score=1)
+        get_importances()
+        
+        Importance.objects.create(label="High", score=5)
+        
+        self.assertEqual([importance.label for importance in get_importances()], ["High", "Low"])
+    
+    def test_importance_delete_invalidates_cache(self):
+        """Test that deleting an importance level refreshes the cached list"""
+        importance = Importance.objects.create(label="Low", score=1)
+        get_importances()
+        
+        importance.delete()
+        
+        self.assertEqual(get_importances(), ())
+    
+    @override_settings(CACHES={'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'importance-max-score-tests',
+    }})
+    def test_get_max_score_is_cached_until_importance_changes(self):
+        """Test that the shared highest score is reused and dropped on save and delete"""
+        invalidate_importances()
+        importance = Importance.objects.create(label="Low", score=1)
+        Importance.get_max_score()
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(Importance.get_max_score(), 1)
+        
+        importance.score = 7
+        importance.save()
+        self.assertEqual(Importance.get_max_score(), 7)
+        
+        importance.delete()
+        self.assertEqual(Importance.get_max_score(), 0)
+
 
 class TargetCategorySignalTests(TestCase):
     """Test signal-triggered recalculation for TargetCategory model"""
@@ -253,6 +400,20 @@ class TargetCategorySignalTests(TestCase):
         self.assertEqual(self.score_day.score, 0)
         self.assertEqual(self.score_day.max_score, 0)
     
+    def test_score_day_delete_cascades_through_signal_handlers(self):
+        """Test that deleting a day with categories and targets doesn't trip the delete handlers"""
+        Target.objects.create(
+            name="Exercise",
+            category=self.category,
+            importance=self.importance,
+            is_achieved=True
+        )
+        
+        self.score_day.delete()
+        
+        self.assertFalse(TargetCategory.objects.filter(pk=self.category.pk).exists())
+        self.assertFalse(Target.objects.exists())
+    
     def test_soft_deleted_category_excluded_from_recalculation(self):
         """Test that soft-deleted categories are excluded from recalculation"""
         # Create target
@@ -272,4 +433,86 @@ class TargetCategorySignalTests(TestCase):
         
         # Day score should be 0 since category is soft deleted
         self.assertEqual(self.score_day.score, 0)
-        self.assertEqual(self.score_day.max_score, 0)
\ No newline at end of file
+        self.assertEqual(self.score_day.max_score, 0)
+    
+    def test_category_score_write_does_not_recalculate_day(self):
+        """Test that calculate_scores on a category doesn't cascade into the day"""
+        self.category.is_deleted = True
+        self.category.save()
+        
+        with patch.object(ScoreDay, 'calculate_scores', autospec=True) as day_calc:
+            self.category.calculate_scores()
+        
+        day_calc.assert_not_called()
+
+
+class CoalescedRecalculationTests(TestCase):
+    """Test that recalculations requested together run once per category and day"""
+    
+    def setUp(self):
+        """Set up test data"""
+        self.importance = Importance.objects.create(label="High", score=5)
+        self.score_day = ScoreDay.objects.create(day=date.today())
+        self.category = TargetCategory.objects.create(
+            day=self.score_day,
+            name="Health"
+        )
+        self.target = Target.objects.create(
+            name="Exercise",
+            category=self.category,
+            importance=self.importance
+        )
+    
+    def test_toggle_achievement_shifts_scores_without_recalculating(self):
+        """Test that toggling a target adjusts the stored scores in place"""
+        with patch.object(ScoreDay, 'calculate_scores', autospec=True,
+                          side_effect=ScoreDay.calculate_scores) as day_calc, \
+                patch.object(TargetCategory, 'calculate_scores', autospec=True,
+                             side_effect=TargetCategory.calculate_scores) as category_calc:
+            self.target.toggle_achievement()
+        
+        self.assertEqual(day_calc.call_count, 0)
+        self.assertEqual(category_calc.call_count, 0)
+        
+        self.score_day.refresh_from_db()
+        self.category.refresh_from_db()
+        self.assertEqual(self.score_day.score, 5)
+        self.assertEqual(self.category.score, 5)
+        
+        self.target.toggle_achievement()
+        
+        self.score_day.refresh_from_db()
+        self.category.refresh_from_db()
+        self.assertEqual(self.score_day.score, 0)
+        self.assertEqual(self.category.score, 0)
+        self.assertEqual(self.category.max_score, 5)
+    
+    def test_saves_inside_block_recalculate_once(self):
+        """Test that several target saves in one block rescore the day once"""
+        with patch.object(ScoreDay, 'calculate_scores', autospec=True,
+                          side_effect=ScoreDay.calculate_scores) as day_calc:
+            with coalesce_recalculations():
+                for name in ["Meditate", "Read", "Walk"]:
+                    Target.objects.create(
+                        name=name,
+                        category=self.category,
+                        importance=self.importance,
+                        is_achieved=True
+                    )
+                self.assertEqual(day_calc.call_count, 0)
+        
+        self.assertEqual(day_calc.call_count, 1)
+        self.score_day.refresh_from_db()
+        self.assertEqual(self.score_day.score, 15)
+        self.assertEqual(self.score_day.max_score, 20)
+    
+    def test_pending_recalculations_dropped_on_error(self):
+        """Test that an error inside the block skips the deferred recalculations"""
+        with patch.object(ScoreDay, 'calculate_scores', autospec=True) as day_calc:
+            with self.assertRaises(RuntimeError):
+                with coalesce_recalculations():
+                    self.target.is_achieved = True
+                    self.target.save()
+                    raise RuntimeError
+        
+        day_calc.assert_not_called()
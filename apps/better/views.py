@@ -1,8 +1,8 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.views import View
 from django.contrib import messages
+from django.core.exceptions import ValidationError
 from django.http import Http404, JsonResponse
-from datetime import timedelta
 from .models import ScoreDay, TargetCategory, Target, Importance
 from .forms import TargetCategoryForm, SleepWakeTimeForm
 
@@ -54,20 +54,23 @@ class TargetCategoryCreateView(View):
         
         if form.is_valid():
             # Set the day to current day before saving
-            category = form.save(commit=False)
-            category.day = current_day
+            form.instance.day = current_day
             
             # Initialize scores as null (will be calculated by signals)
-            category.score = None
-            category.max_score = None
-            category.save()
+            form.instance.score = None
+            form.instance.max_score = None
             
-            messages.success(
-                request, 
-                f'Category "{category.name}" has been created successfully.'
-            )
-            
-            return redirect('better:dashboard')
+            try:
+                category = form.save()
+            except ValidationError:
+                pass  # Duplicate name for the day, the form now carries the error
+            else:
+                messages.success(
+                    request, 
+                    f'Category "{category.name}" has been created successfully.'
+                )
+                
+                return redirect('better:dashboard')
         
         # Form has errors, re-render with errors
         context = {
@@ -241,71 +244,9 @@ class DayView(View):
         # Create sleep/wake time form for this day
         sleep_wake_form = SleepWakeTimeForm(instance=score_day)
         
-        # Get yesterday's ScoreDay for comparison
-        yesterday_day = ScoreDay.objects.filter(
-            day=target_date - timedelta(days=1),
-            is_deleted=False
-        ).first()
-        
-        # Get all categories for this day with their targets
-        categories = score_day.categories.filter(is_deleted=False).prefetch_related(
-            'targets__importance'
-        ).order_by('name')
-        
-        # Prepare categories data
-        categories_data = []
-        for category in categories:
-            targets = category.targets.filter(is_deleted=False).order_by('-importance__score', 'name')
-            category.yesterday_change = category.get_yesterday_change()
-            categories_data.append({
-                'category': category,
-                'targets': targets,
-                'achieved_count': targets.filter(is_achieved=True).count(),
-                'total_count': targets.count(),
-                'normalized_score': category.get_normalized_score()
-            })
-        
-        # Prepare yesterday's categories data
-        yesterday_categories = []
-        if yesterday_day:
-            for category in yesterday_day.categories.filter(is_deleted=False).order_by('name'):
-                yesterday_categories.append({
-                    'category': category,
-                    'targets': category.targets.filter(is_deleted=False),
-                    'achieved_count': category.targets.filter(is_deleted=False, is_achieved=True).count(),
-                    'total_count': category.targets.filter(is_deleted=False).count(),
-                })
-        
-        # Get available importance levels
-        importance_levels = Importance.objects.all().order_by('-score')
-        
-        # Calculate progress percentage
-        progress_percentage = 0
-        if score_day.max_score and score_day.max_score > 0:
-            progress_percentage = round((score_day.score / score_day.max_score) * 100, 1)
-        
-        score_day.yesterday_change = score_day.get_yesterday_change()
-        
-        # Check if this is today
-        from django.utils import timezone
-        is_today = target_date == timezone.now().date()
-        
-        context = {
-            'current_day': score_day,
-            'yesterday_day': yesterday_day,
-            'categories_data': categories_data,
-            'yesterday_categories': yesterday_categories,
-            'progress_percentage': progress_percentage,
-            'normalized_daily_score': score_day.get_normalized_score(),
-            'importance_levels': importance_levels,
-            'has_categories': categories.exists(),
-            'has_importance_levels': importance_levels.exists(),
-            'sleep_wake_form': sleep_wake_form,
-            'is_first_day': yesterday_day is None,
-            'has_yesterday_data': yesterday_day is not None and yesterday_categories,
-            'is_today': is_today,
-            'viewing_date': target_date,
-        }
+        # Same data as the dashboard, plus the date being viewed
+        context = score_day.get_dashboard_context(sleep_wake_form)
+        context['viewing_date'] = target_date
         
         return render(request, "better/dashboard.html", context)
     